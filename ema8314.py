@@ -20,8 +20,12 @@
 Library for EMA-8314 ethernet I/O module.
 """
 
+import asyncio
 import struct
 import socket
+import selectors
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 
 __author__ = "Mathis Reuß-Hennschen"
 __copyright__ = "Copyright 2022 Mathis Reuß-Hennschen"
@@ -44,28 +48,23 @@ __version__ = "1.0"
 # =========================================================================== #
 # Note
 # --------------------------------------------------------------------------- #
-# Sometimes the UDP socket or the Python implementation appears to be choking
-# up when trying to receive a reply to a request in SOCK.recvfrom(). A solu-
-# tion that appears to be stable is:
+# Every request is sent again if no reply arrives within TIMEOUT seconds and
+# socket.timeout is raised after RETRIES attempts. reboot_device(),
+# change_socket_port(), password_change() and change_ip() are sent only once
+# and wait CONFIG_TIMEOUT seconds instead. To wait for a device that stopped
+# answering, poll is_alive() instead of repeating a full request:
 #
 # import ema8314 as e
 # import time
 # 
 # e.init(...)
-# connected = True
 # 
 # try:
 #     [EMA function]
-# except:
-#     connected = False
-#     try:
-#         e.firmware_version_read()
-#         connected = True
-#     except:
+# except OSError:
+#     while not e.is_alive():
 #         print("waiting...")
 #         time.sleep(2)
-# 
-# for some reason this works
 # =========================================================================== #
 
 # initializing variables
@@ -78,18 +77,153 @@ TARGETPORT = 0
 PASSWORD = "12345678"
 SOCK = 0
 
+# seconds to wait for a reply before a request is sent again
+TIMEOUT = 0.2
+# attempts per request before socket.timeout is raised
+RETRIES = 3
+# seconds to wait for the reply to a command that must not be carried out
+# twice and is therefore sent only once (reboot, new IP, port or password)
+CONFIG_TIMEOUT = 2.0
+
+
+# =========================================================================== #
+# packet layouts
+# --------------------------------------------------------------------------- #
+# Every request starts with the card ID (7 bytes), the password (8 bytes) and
+# the command byte; every reply is 34 bytes long. The formats are compiled
+# once here instead of being parsed again on every call.
+# =========================================================================== #
+
+# requests (header, then the payload that follows it)
+_REQ_HEADER = struct.Struct("<7s8sc")
+_REQ_PASSWORD = struct.Struct("<8s")
+_REQ_TEMP_LIMIT = struct.Struct("<ccccffccccccccc")
+_REQ_TEMP_LIMIT_ALL = struct.Struct("<ccccffffcc")
+_REQ_SENSOR_TYPE = struct.Struct("<cccc16sc")
+_REQ_SENSOR_TYPE_ALL = struct.Struct("<cccc16scccc")
+
+# replies: each field is read from its absolute offset
+_RSP_FLOAT = struct.Struct("<f")
+_RSP_FLOAT2 = struct.Struct("<2f")
+_RSP_FLOAT4 = struct.Struct("<4f")
+_RSP_WDT = struct.Struct("<hBB")
+
+_OFS_FLOAT = 4      # first float (temperature or threshold)
+_OFS_UNIT = 20      # first unit / sensor type byte
+_OFS_STATUS = 24    # sensor status / comparison status byte
+_OFS_FLAG = 32      # flag byte
+
+# command bytes known to the device
+_OPCODES = (tuple(range(0x02, 0x08)) +
+            tuple(range(0x30, 0x34)) +
+            tuple(range(0x50, 0x66)))
+
+# commands whose only payload is the channel number
+_CHANNEL_OPCODES = (0x50, 0x53, 0x57)
+
+# device created by init(), which the module-level functions work on
+_default = None
+
+# result of every command whose reply only carries the flag
+_EMPTY_RESULT = ()
+
+# card ID as sent at the start of every request
+_CARDID_BYTES = bytes(_CARDID, "utf8")
+
+# padding bytes in requests
+_NUL = b"\x00"
+_NUL16 = _NUL * 16
+
+# result of the reads that return one bit per channel; still a plain tuple
+# for callers that index it
+ChannelBits = namedtuple("ChannelBits", ("ch0", "ch1", "ch2", "ch3"))
+
+# one bit per channel -> (channel 0, channel 1, channel 2, channel 3); the 16
+# possible results are built once and shared, so reading them allocates nothing
+_NIBBLE_LUT = tuple(ChannelBits(n & 1, (n & 2) >> 1, (n & 4) >> 2, (n & 8) >> 3)
+                    for n in range(16))
+
+# raw unit byte -> temperature unit, and back
+_UNIT_TABLE = ("?", "C", "F") + ("?",) * 253
+_UNIT_CODE = {"C": b"\x01", "F": b"\x02"}
+
+# raw sensor type byte -> sensor type, and back
+_SENSOR_TABLE = ("?", "Pt-1000", "Pt-100") + ("?",) * 253
+_SENSOR_CODE = {"Pt-1000": b"\x01", "Pt-100": b"\x02"}
+
 
 # =========================================================================== #
 # starting and closing functions
 # =========================================================================== #
 
+def _pack_prefixes(password):
+    """
+    Pack the request header (card ID, password and command byte) once for
+    every command.
+
+    Parameters
+    ----------
+    password : str
+        Up to 8 ASCII bytes.
+
+    Returns
+    -------
+    prefixes : dict
+        Packed header per command byte.
+
+    """
+    password = bytes(password, "utf8")
+
+    prefixes = {}
+
+    for opcode in _OPCODES:
+        prefixes[opcode] = _REQ_HEADER.pack(_CARDID_BYTES,
+                                            password,
+                                            bytes((opcode,)))
+
+    return prefixes
+
+
+def _pack_channel_requests(prefixes):
+    """
+    Pack the complete request for every channel of the commands that only
+    take a channel number, so reading a channel needs no packing at all.
+
+    Parameters
+    ----------
+    prefixes : dict
+        Packed header per command byte, see _pack_prefixes().
+
+    Returns
+    -------
+    requests : dict
+        Request per channel (0 to 3) per command byte.
+
+    """
+    requests = {}
+
+    for opcode in _CHANNEL_OPCODES:
+        prefix = prefixes[opcode]
+
+        # keyed by channel: -1 or 4 raise KeyError instead of reading another
+        # channel the way a negative tuple index would
+        requests[opcode] = {channel: prefix + bytes((0, 0, 0, channel))
+                            for channel in range(4)}
+
+    # control_mode_read() only sends a zero byte before the channel number
+    requests[0x65] = {channel: prefixes[0x65] + bytes((0, channel))
+                      for channel in range(4)}
+
+    return requests
+
+
 def init(host_ip,
          host_port,
          target_ip,
          target_port,
          password=PASSWORD):
     """
-    Create the socket. [MANDATORY]
+    Create the socket and connect it to the device. [MANDATORY]
 
     Parameters
     ----------
@@ -109,16 +243,13 @@ def init(host_ip,
     None.
 
     """
+    global _default
     global SOCK
 
-    # socket creation
-    SOCK = socket.socket(family=socket.AF_INET,
-                         type=socket.SOCK_DGRAM)
-    SOCK.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-    SOCK.settimeout(5)
+    # the module-level functions work on this device
+    _default = EMA8314(host_ip, host_port, target_ip, target_port, password)
 
-    # socket bind
-    SOCK.bind((host_ip, host_port))
+    SOCK = _default.sock
 
     global HOSTIP
     global HOSTPORT
@@ -142,1521 +273,2025 @@ def close_socket():
     None.
 
     """
-    SOCK.close()
+    _default.close()
 
 
 # =========================================================================== #
-# configuration functions
+# reply parsers, shared by the commands and poll_batch()
 # =========================================================================== #
 
-def reboot_device():
+def _parse_firmware(reply):
     """
-    Reboot the device.
+    Parse the reply to firmware_version_read().
+
+    Parameters
+    ----------
+    reply : bytes-like
+        34 byte reply.
 
     Returns
     -------
     result : tuple
-        Empty.
+        See firmware_version_read().
     flag : char
         99 (0x63) when successful.
 
     """
-    # 0x02
-
-    bytes_to_send = struct.pack("7s8sc",
-                                bytes(_CARDID, "utf8"),
-                                bytes(PASSWORD, "utf8"),
-                                bytes("\x02", "utf8"))
-
-    SOCK.sendto(bytes_to_send, (TARGETIP, TARGETPORT))
+    result = (str(reply[1]) + "." + str(reply[2]),)
 
-    msg = SOCK.recvfrom(34)
-
-    parsed = struct.unpack("xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx", msg[0])
-
-    result = parsed
-
-    flag = msg[0][-2]
+    flag = reply[_OFS_FLAG]
 
     return (result, flag)
 
 
-def change_socket_port(new_socket_port):
+def _parse_output(reply):
     """
-    Change the socket port.
+    Parse the reply to output_read() and output_mode_read().
 
     Parameters
     ----------
-    new_socket_port : int
-        From 0 to 65535.
+    reply : bytes-like
+        34 byte reply.
 
     Returns
     -------
     result : tuple
-        Empty.
+        See output_read() / output_mode_read().
     flag : char
         99 (0x63) when successful.
 
     """
-    # 0x03
-
-    bytes_to_send = struct.pack("7s8sc2s",
-                                bytes(_CARDID, "utf8"),
-                                bytes(PASSWORD, "utf8"),
-                                bytes("\x03", "utf8"),
-                                new_socket_port.to_bytes(2, "little"))
-
-    SOCK.sendto(bytes_to_send, (TARGETIP, TARGETPORT))
-
-    msg = SOCK.recvfrom(34)
+    result = _NIBBLE_LUT[reply[1] & 0xF]
 
-    parsed = struct.unpack("xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx", msg[0])
-
-    result = parsed
-
-    flag = msg[0][-2]
+    flag = reply[_OFS_FLAG]
 
     return (result, flag)
 
 
-def password_change(new_password):
+def _parse_temperature(reply):
     """
-    Change the password.
+    Parse the reply to channel_temperature_read().
 
     Parameters
     ----------
-    new_password : str
-        Up to 8 ASCII bytes.
+    reply : bytes-like
+        34 byte reply.
 
     Returns
     -------
     result : tuple
-        Empty.
+        See channel_temperature_read().
     flag : char
         99 (0x63) when successful.
 
     """
-    # 0x04
-
-    bytes_to_send = struct.pack("7s8sc8s",
-                                bytes(_CARDID, "utf8"),
-                                bytes(PASSWORD, "utf8"),
-                                bytes("\x04", "utf8"),
-                                bytes(new_password, "utf8"))
-
-    SOCK.sendto(bytes_to_send, (TARGETIP, TARGETPORT))
-
-    msg = SOCK.recvfrom(34)
-
-    parsed = struct.unpack("xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx", msg[0])
+    temp = _RSP_FLOAT.unpack_from(reply, _OFS_FLOAT)[0]
 
-    result = parsed
+    result = (temp, _UNIT_TABLE[reply[_OFS_UNIT]])
 
-    flag = msg[0][-2]
+    flag = reply[_OFS_FLAG]
 
     return (result, flag)
 
 
-def password_set_default():
+def _parse_all_temperature(reply):
     """
-    Set the password back to default.
+    Parse the reply to all_temperature_read().
+
+    Parameters
+    ----------
+    reply : bytes-like
+        34 byte reply.
 
     Returns
     -------
     result : tuple
-        Empty.
+        See all_temperature_read().
     flag : char
         99 (0x63) when successful.
 
     """
-    # 0x05
-
-    bytes_to_send = struct.pack("7s8sc",
-                                bytes(_CARDID, "utf8"),
-                                bytes(PASSWORD, "utf8"),
-                                bytes("\x05", "utf8"))
-
-    SOCK.sendto(bytes_to_send, (TARGETIP, TARGETPORT))
-
-    msg = SOCK.recvfrom(34)
-
-    parsed = struct.unpack("xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx", msg[0])
+    temp = _RSP_FLOAT4.unpack_from(reply, _OFS_FLOAT)
 
-    result = parsed
+    result = (temp[0], _UNIT_TABLE[reply[_OFS_UNIT]],
+              temp[1], _UNIT_TABLE[reply[_OFS_UNIT + 1]],
+              temp[2], _UNIT_TABLE[reply[_OFS_UNIT + 2]],
+              temp[3], _UNIT_TABLE[reply[_OFS_UNIT + 3]])
 
-    flag = msg[0][-2]
+    flag = reply[_OFS_FLAG]
 
     return (result, flag)
 
 
-def change_ip(new_ip):
+def _parse_sensor_status(reply):
     """
-    Change the IP.
+    Parse the reply to all_sensor_status_read().
 
     Parameters
     ----------
-    new_ip : str
-        Normal IPv4 format – four groups of digits divided with a dot.
+    reply : bytes-like
+        34 byte reply.
 
     Returns
     -------
     result : tuple
-        Empty.
+        See all_sensor_status_read().
     flag : char
         99 (0x63) when successful.
 
     """
-    # 0x06
-
-    split_ip = [0, 0, 0, 0]
-
-    for i in range(0, 4):
-        split_ip[i] = int(new_ip.split(".")[i]).to_bytes(1, "big")
-
-    bytes_to_send = struct.pack("7s8sccccc",
-                                bytes(_CARDID, "utf8"),
-                                bytes(PASSWORD, "utf8"),
-                                bytes("\x06", "utf8"),
-                                split_ip[0], split_ip[1], split_ip[2], split_ip[3])
-
-    SOCK.sendto(bytes_to_send, (TARGETIP, TARGETPORT))
-
-    msg = SOCK.recvfrom(34)
-
-    parsed = struct.unpack("xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx", msg[0])
+    result = _NIBBLE_LUT[reply[_OFS_STATUS] & 0xF]
 
-    result = parsed
-
-    flag = msg[0][-2]
+    flag = reply[_OFS_FLAG]
 
     return (result, flag)
 
 
-def firmware_version_read():
+def _parse_all_sensor_type(reply):
     """
-    Read the firmware version.
+    Parse the reply to all_sensor_type_read().
+
+    Parameters
+    ----------
+    reply : bytes-like
+        34 byte reply.
 
     Returns
     -------
     result : tuple
-        str | 'x.y' (x is the main version number, y is the subversion number. Example: 1.0)
+        See all_sensor_type_read().
     flag : char
         99 (0x63) when successful.
 
     """
-    # 0x07
-
-    bytes_to_send = struct.pack("7s8sc",
-                                bytes(_CARDID, "utf8"),
-                                bytes(PASSWORD, "utf8"),
-                                bytes("\x07", "utf8"))
-
-    SOCK.sendto(bytes_to_send, (TARGETIP, TARGETPORT))
-
-    msg = SOCK.recvfrom(34)
-
-    parsed = struct.unpack("xccxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx", msg[0])
+    result = (_SENSOR_TABLE[reply[_OFS_UNIT]],
+              _SENSOR_TABLE[reply[_OFS_UNIT + 1]],
+              _SENSOR_TABLE[reply[_OFS_UNIT + 2]],
+              _SENSOR_TABLE[reply[_OFS_UNIT + 3]])
 
-    result = (str(ord(parsed[0])) + "." + str(ord(parsed[1])),)
-    flag = msg[0][-2]
+    flag = reply[_OFS_FLAG]
 
     return (result, flag)
 
 
-# =========================================================================== #
-# output functions
-# =========================================================================== #
-
-def output_set(output0,
-               output1,
-               output2,
-               output3):
+def _parse_control_status(reply):
     """
-    Set output status; only for general purpose output, not for control.
+    Parse the reply to control_status_read().
 
     Parameters
     ----------
-    output0 : int
-        Output status OUT0 (0 [inactive] / 1 [active]).
-    output1 : int
-        Output status OUT1 (0 [inactive] / 1 [active]).
-    output2 : int
-        Output status OUT2 (0 [inactive] / 1 [active]).
-    output3 : int
-        Output status OUT3 (0 [inactive] / 1 [active]).
+    reply : bytes-like
+        34 byte reply.
 
     Returns
     -------
     result : tuple
-        Empty.
+        See control_status_read().
     flag : char
         99 (0x63) when successful.
 
     """
-    # 0x30
-
-    output = (1 * output0) | (2 * output1) | (4 * output2) | (8 * output3)
+    result = (reply[_OFS_STATUS] - 1,)
 
-    bytes_to_send = struct.pack("7s8sccc",
-                                bytes(_CARDID, "utf8"),
-                                bytes(PASSWORD, "utf8"),
-                                bytes("\x30", "utf8"),
-                                bytes("\x00", "utf8"),
-                                output.to_bytes(1, "big"))
-
-    SOCK.sendto(bytes_to_send, (TARGETIP, TARGETPORT))
-
-    msg = SOCK.recvfrom(34)
-
-    parsed = struct.unpack("xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx", msg[0])
-
-    result = parsed
-
-    flag = msg[0][-2]
+    flag = reply[_OFS_FLAG]
 
     return (result, flag)
 
 
-def output_read():
+def _parse_control_mask(reply):
     """
-    Read the output status.
+    Parse the reply to control_mask_read().
+
+    Parameters
+    ----------
+    reply : bytes-like
+        34 byte reply.
 
     Returns
     -------
     result : tuple
-        int | Output status OUT0 (0 [inactive] / 1 [active]). \n
-        int | Output status OUT1 (0 [inactive] / 1 [active]). \n
-        int | Output status OUT2 (0 [inactive] / 1 [active]). \n
-        int | Output status OUT3 (0 [inactive] / 1 [active]).
+        See control_mask_read().
     flag : char
         99 (0x63) when successful.
 
     """
-    # 0x31
-
-    bytes_to_send = struct.pack("7s8sc",
-                                bytes(_CARDID, "utf8"),
-                                bytes(PASSWORD, "utf8"),
-                                bytes("\x31", "utf8"))
-
-    SOCK.sendto(bytes_to_send, (TARGETIP, TARGETPORT))
-
-    msg = SOCK.recvfrom(34)
+    result = _NIBBLE_LUT[reply[1] & 0xF]
 
-    parsed = struct.unpack("xcxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx", msg[0])
-
-    result = (ord(parsed[0]) & 1,
-              (ord(parsed[0]) & 2) >> 1,
-              (ord(parsed[0]) & 4) >> 2,
-              (ord(parsed[0]) & 8) >> 3)
-
-    flag = msg[0][-2]
+    flag = reply[_OFS_FLAG]
 
     return (result, flag)
 
 
-def output_mode_set(output_mode0,
-                    output_mode1,
-                    output_mode2,
-                    output_mode3):
+def _parse_wdt(reply):
     """
-    Set the output mode.
+    Parse the reply to wdt_read().
 
     Parameters
     ----------
-    output_mode0 : int
-        Output mode OUT0 (0 [general purpose] / 1 [temperature control]).
-    output_mode1 : int
-        Output mode OUT1 (0 [general purpose] / 1 [temperature control]).
-    output_mode2 : int
-        Output mode OUT2 (0 [general purpose] / 1 [temperature control]).
-    output_mode3 : int
-        Output mode OUT3 (0 [general purpose] / 1 [temperature control]).
+    reply : bytes-like
+        34 byte reply.
 
     Returns
     -------
     result : tuple
-        Empty.
+        See wdt_read().
     flag : char
         99 (0x63) when successful.
 
     """
-    # 0x32
+    parsed = _RSP_WDT.unpack_from(reply)
 
-    output = (1 * output_mode0) | (2 * output_mode1) | \
-             (4 * output_mode2) | (8 * output_mode3)
+    outputs = _NIBBLE_LUT[reply[2] & 0xF]
 
-    bytes_to_send = struct.pack("7s8sccc",
-                                bytes(_CARDID, "utf8"),
-                                bytes(PASSWORD, "utf8"),
-                                bytes("\x30", "utf8"),
-                                bytes("\x00", "utf8"),
-                                output.to_bytes(1, "big"))
+    result = (outputs[0],
+              outputs[1],
+              outputs[2],
+              outputs[3],
+              parsed[0],
+              parsed[2] - 1)
 
-    SOCK.sendto(bytes_to_send, (TARGETIP, TARGETPORT))
+    flag = reply[_OFS_FLAG]
 
-    msg = SOCK.recvfrom(34)
+    return (result, flag)
 
-    parsed = struct.unpack("xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx", msg[0])
 
-    result = parsed
+# =========================================================================== #
+# batch polling
+# --------------------------------------------------------------------------- #
+# Several reads are sent back to back and their replies collected afterwards,
+# so the round trips overlap instead of adding up:
+#
+# e.poll_batch([("channel_temperature_read", channel) for channel in range(4)])
+# =========================================================================== #
 
-    flag = msg[0][-2]
+# reads poll_batch() can combine -> (command byte, reply parser)
+_BATCH_READS = {"firmware_version_read": (0x07, _parse_firmware),
+                "output_read": (0x31, _parse_output),
+                "output_mode_read": (0x33, _parse_output),
+                "channel_temperature_read": (0x50, _parse_temperature),
+                "all_temperature_read": (0x51, _parse_all_temperature),
+                "all_sensor_type_read": (0x59, _parse_all_sensor_type),
+                "all_sensor_status_read": (0x5A, _parse_sensor_status),
+                "control_status_read": (0x5B, _parse_control_status),
+                "control_mask_read": (0x5F, _parse_control_mask),
+                "wdt_read": (0x63, _parse_wdt)}
 
-    return (result, flag)
 
+# =========================================================================== #
+# device objects
+# --------------------------------------------------------------------------- #
+# Each EMA8314 has its own socket, so one process can talk to several devices:
+#
+# devices = [e.EMA8314(...), e.EMA8314(...)]
+# readings = [d.all_temperature_read() for d in devices]
+#
+# The module-level functions further below work on the device created by
+# init().
+# =========================================================================== #
 
-def output_mode_read():
+class EMA8314:
     """
-    Read the output mode.
-
-    Returns
-    -------
-    result : tuple
-        int | Output mode OUT0 (0 [general purpose] / 1 [temperature control]). \n
-        int | Output mode OUT1 (0 [general purpose] / 1 [temperature control]). \n
-        int | Output mode OUT2 (0 [general purpose] / 1 [temperature control]). \n
-        int | Output mode OUT3 (0 [general purpose] / 1 [temperature control]).
-    flag : char
-        99 (0x63) when successful.
+    Connection to one device.
 
+    Parameters
+    ----------
+    host_ip : str
+        Normal IPv4 format – four groups of digits divided with a dot.
+    host_port : int
+        From 0 to 65535.
+    target_ip : str
+        Normal IPv4 format – four groups of digits divided with a dot.
+    target_port : int
+        From 1024 to 65535.
+    password : str [optional; if empty: default password "12345678"]
+        Up to 8 ASCII bytes.
     """
-    # 0x33
 
-    bytes_to_send = struct.pack("7s8sc",
-                                bytes(_CARDID, "utf8"),
-                                bytes(PASSWORD, "utf8"),
-                                bytes("\x33", "utf8"))
+    __slots__ = ("sock", "sel", "target", "prefix", "channel_request",
+                 "rx_buf", "pending", "fw", "_send", "_recv_into", "_select")
+
+    def __init__(self,
+                 host_ip,
+                 host_port,
+                 target_ip,
+                 target_port,
+                 password=PASSWORD):
+        # socket creation
+        self.sock = socket.socket(family=socket.AF_INET,
+                                  type=socket.SOCK_DGRAM)
+        self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.sock.setblocking(False)
+
+        # socket bind
+        self.sock.bind((host_ip, host_port))
+
+        # fix the peer once, so neither send() nor the kernel has to resolve
+        # it for every request and only replies from the device are received
+        self.sock.connect((target_ip, target_port))
+        self.target = target_ip
+
+        # replies are waited for with the selector, see request()
+        self.sel = selectors.DefaultSelector()
+        self.sel.register(self.sock, selectors.EVENT_READ)
+
+        # packed request header per command byte, and the complete request
+        # per channel for the commands that only take a channel number
+        self.prefix = _pack_prefixes(password)
+        self.channel_request = _pack_channel_requests(self.prefix)
+
+        # every reply is received into this buffer and parsed from there
+        self.rx_buf = bytearray(34)
+
+        # requests sent whose reply has not been received yet; replies to
+        # requests that timed out may still arrive later
+        self.pending = 0
+
+        # last successful firmware_version_read()
+        self.fw = None
+
+        # look the methods up once instead of on every request
+        self._send = self.sock.send
+        self._recv_into = self.sock.recv_into
+        self._select = self.sel.select
+
+    # ======================================================================= #
+    # transport
+    # ======================================================================= #
+
+    def drain(self):
+        """
+        Wait for the replies still pending from requests that timed out and
+        throw them away, so they are not mistaken for the reply to the next
+        request. A reply that does not arrive within TIMEOUT seconds is
+        considered lost.
+
+        Returns
+        -------
+        None.
+
+        """
+        while self.pending and self._select(TIMEOUT):
+            self._recv_into(self.rx_buf, 34)
+            self.pending -= 1
+
+        self.pending = 0
+
+    def request(self, bytes_to_send, retries=None, timeout=None):
+        """
+        Send one request and receive its reply into rx_buf. A request that
+        gets no reply within timeout seconds is sent again, up to retries
+        times. The first reply to any of the attempts is taken, the ones to
+        the other attempts are thrown away before the next request.
+
+        Parameters
+        ----------
+        bytes_to_send : bytes
+            Complete request.
+        retries : int [optional; if empty: RETRIES]
+            Attempts before socket.timeout is raised; 1 for commands that must
+            not be carried out twice.
+        timeout : float [optional; if empty: TIMEOUT]
+            Seconds to wait for the reply to each attempt.
+
+        Returns
+        -------
+        reply : bytearray
+            34 byte reply (rx_buf, overwritten by the next request).
+
+        """
+        if retries is None:
+            retries = RETRIES
+
+        if timeout is None:
+            timeout = TIMEOUT
+
+        if self.pending:
+            self.drain()
+
+        for attempt in range(retries):
+            self._send(bytes_to_send)
+            self.pending += 1
+
+            if self._select(timeout):
+                self._recv_into(self.rx_buf, 34)
+                self.pending -= 1
+                return self.rx_buf
+
+        raise socket.timeout("no reply from " + str(self.target))
+
+    def send_pipelined(self, packets):
+        """
+        Send several requests back to back and only then collect the replies,
+        so the device already works on the next request while the previous
+        reply is still on the wire. The device answers in order, so reply n
+        belongs to request n. If not all replies arrive, the ones still
+        outstanding are waited for and thrown away, then the whole batch is
+        sent again, up to RETRIES times.
 
-    SOCK.sendto(bytes_to_send, (TARGETIP, TARGETPORT))
+        Parameters
+        ----------
+        packets : sequence of bytes
+            Complete requests.
 
-    msg = SOCK.recvfrom(34)
+        Returns
+        -------
+        replies : list
+            One 34 byte reply per request (memoryview slices of one buffer).
 
-    parsed = struct.unpack("xcxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx", msg[0])
+        """
+        count = len(packets)
 
-    result = (ord(parsed[0]) & 1,
-              (ord(parsed[0]) & 2) >> 1,
-              (ord(parsed[0]) & 4) >> 2,
-              (ord(parsed[0]) & 8) >> 3)
+        # all replies are received into one buffer, 34 bytes per request
+        view = memoryview(bytearray(34 * count))
+        replies = [view[34 * n:34 * (n + 1)] for n in range(count)]
 
-    flag = msg[0][-2]
+        for attempt in range(RETRIES):
+            if self.pending:
+                self.drain()
 
-    return (result, flag)
+            for bytes_to_send in packets:
+                self._send(bytes_to_send)
 
+            self.pending += count
+            received = 0
 
-# =========================================================================== #
-# Analog measurement functions
-# =========================================================================== #
+            while received < count and self._select(TIMEOUT):
+                self._recv_into(replies[received], 34)
+                received += 1
 
-def channel_temperature_read(channel):
-    """
-    Read the temperature and unit from one channel.
+            self.pending -= received
 
-    Parameters
-    ----------
-    channel : int
-        Channel to read from (0 / 1 / 2 / 3).
+            if received == count:
+                return replies
 
-    Returns
-    -------
-    result : tuple
-        float | Measured temperature. \n
-        str | Temperature unit ('C' / 'F').
-    flag : char
-        99 (0x63) when successful.
+        raise socket.timeout("no reply from " + str(self.target))
 
-    """
-    # 0x50
+    def close(self):
+        """
+        Close the socket.
 
-    bytes_to_send = struct.pack("7s8sccccc",
-                                bytes(_CARDID, "utf8"),
-                                bytes(PASSWORD, "utf8"),
-                                bytes("\x50", "utf8"),
-                                bytes("\x00", "utf8"),
-                                bytes("\x00", "utf8"),
-                                bytes("\x00", "utf8"),
-                                channel.to_bytes(1, "big"))
+        Returns
+        -------
+        None.
 
-    SOCK.sendto(bytes_to_send, (TARGETIP, TARGETPORT))
+        """
+        self.sel.close()
+        self.sock.close()
 
-    msg = SOCK.recvfrom(34)
+    # ======================================================================= #
+    # configuration functions
+    # ======================================================================= #
 
-    parsed = struct.unpack("xxxxfxxxxxxxxxxxxcxxxxxxxxxxxxx", msg[0])
+    def reboot_device(self):
+        """
+        Reboot the device.
 
-    if parsed[1] == b'\x01':
-        unit = "C"
+        Returns
+        -------
+        result : tuple
+            Empty.
+        flag : char
+            99 (0x63) when successful.
 
-    if parsed[1] == b'\x02':
-        unit = "F"
+        """
+        # 0x02
 
-    result = (parsed[0], unit)
+        bytes_to_send = self.prefix[0x02]
 
-    flag = msg[0][-2]
+        self.request(bytes_to_send, retries=1, timeout=CONFIG_TIMEOUT)
 
-    return (result, flag)
+        flag = self.rx_buf[_OFS_FLAG]
 
+        result = _EMPTY_RESULT
 
-def all_temperature_read():
-    """
-    Read the temperature and unit from all channels.
+        return (result, flag)
 
-    Returns
-    -------
-    result : tuple
-        float | Measured temperature channel 0. \n
-        str | Temperature unit channel 0 ('C' / 'F'). \n
-        float | Measured temperature channel 1. \n
-        str | Temperature unit channel 1 ('C' / 'F'). \n
-        float | Measured temperature channel 2. \n
-        str | Temperature unit channel 2 ('C' / 'F'). \n
-        float | Measured temperature channel 3. \n
-        str | Temperature unit channel 3 ('C' / 'F').
-    flag : char
-        99 (0x63) when successful.
+    def change_socket_port(self, new_socket_port):
+        """
+        Change the socket port.
 
-    """
-    # 0x51
+        Parameters
+        ----------
+        new_socket_port : int
+            From 0 to 65535.
 
-    bytes_to_send = struct.pack("7s8sc",
-                                bytes(_CARDID, "utf8"),
-                                bytes(PASSWORD, "utf8"),
-                                bytes("\x51", "utf8"))
+        Returns
+        -------
+        result : tuple
+            Empty.
+        flag : char
+            99 (0x63) when successful.
 
-    SOCK.sendto(bytes_to_send, (TARGETIP, TARGETPORT))
+        """
+        # 0x03
 
-    msg = SOCK.recvfrom(34)
+        payload = new_socket_port.to_bytes(2, "little")
 
-    unit = [0, 0, 0, 0]
+        bytes_to_send = self.prefix[0x03] + payload
 
-    parsed = struct.unpack("xxxxffffccccxxxxxxxxxx", msg[0])
-    for i in range(4, 8):
-        if parsed[i] == b'\x01':
-            unit[i-4] = "C"
+        self.request(bytes_to_send, retries=1, timeout=CONFIG_TIMEOUT)
 
-        if parsed[i] == b'\x02':
-            unit[i-4] = "F"
+        flag = self.rx_buf[_OFS_FLAG]
 
-    result = (parsed[0], unit[0],
-              parsed[1], unit[1],
-              parsed[2], unit[2],
-              parsed[3], unit[3])
+        result = _EMPTY_RESULT
 
-    flag = msg[0][-2]
+        return (result, flag)
 
-    return (result, flag)
+    def password_change(self, new_password):
+        """
+        Change the password.
 
+        Parameters
+        ----------
+        new_password : str
+            Up to 8 ASCII bytes.
 
-# =========================================================================== #
-# parameter functions
-# =========================================================================== #
+        Returns
+        -------
+        result : tuple
+            Empty.
+        flag : char
+            99 (0x63) when successful.
 
-def channel_temperature_limit_set(channel,
-                                  temperature_low,
-                                  temperature_high,
-                                  temperature_unit):
-    """
-    Set temperature limits for one channel.
+        """
+        # 0x04
 
-    Parameters
-    ----------
-    channel : int
-        Channel to set (0 / 1 / 2 / 3).
-    temperature_low : float
-        Low temperature threshold.
-    temperature_high : float
-        High temperature threshold.
-    temperature_unit : str
-        Temperature unit ('C' / 'F').
+        payload = _REQ_PASSWORD.pack(bytes(new_password, "utf8"))
 
-    Returns
-    -------
-    result : tuple
-        Empty.
-    flag : char
-        99 (0x63) when successful.
+        bytes_to_send = self.prefix[0x04] + payload
 
-    """
-    # 0x52
+        self.request(bytes_to_send, retries=1, timeout=CONFIG_TIMEOUT)
 
-    if temperature_unit == "C":
-        unit = b'\x01'
+        flag = self.rx_buf[_OFS_FLAG]
 
-    if temperature_unit == "F":
-        unit = b'\x02'
+        result = _EMPTY_RESULT
 
-    bytes_to_send = struct.pack("7s8scccccffccccccccc",
-                                bytes(_CARDID, "utf8"),
-                                bytes(PASSWORD, "utf8"),
-                                bytes("\x52", "utf8"),
-                                bytes("\x00", "utf8"),
-                                bytes("\x00", "utf8"),
-                                bytes("\x00", "utf8"),
-                                channel.to_bytes(1, "big"),
-                                temperature_low,
-                                temperature_high,
-                                bytes("\x00", "utf8"),
-                                bytes("\x00", "utf8"),
-                                bytes("\x00", "utf8"),
-                                bytes("\x00", "utf8"),
-                                bytes("\x00", "utf8"),
-                                bytes("\x00", "utf8"),
-                                bytes("\x00", "utf8"),
-                                bytes("\x00", "utf8"),
-                                unit)
+        return (result, flag)
 
-    SOCK.sendto(bytes_to_send, (TARGETIP, TARGETPORT))
+    def password_set_default(self):
+        """
+        Set the password back to default.
 
-    msg = SOCK.recvfrom(34)
+        Returns
+        -------
+        result : tuple
+            Empty.
+        flag : char
+            99 (0x63) when successful.
 
-    parsed = struct.unpack("xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx", msg[0])
+        """
+        # 0x05
 
-    result = parsed
+        bytes_to_send = self.prefix[0x05]
 
-    flag = msg[0][-2]
+        self.request(bytes_to_send)
 
-    return (result, flag)
+        flag = self.rx_buf[_OFS_FLAG]
 
+        result = _EMPTY_RESULT
 
-def channel_temperature_limit_read(channel):
-    """
-    Read temperature limits from one channel.
+        return (result, flag)
 
-    Parameters
-    ----------
-    channel : int
-        Channel to read from (0 / 1 / 2 / 3).
+    def change_ip(self, new_ip):
+        """
+        Change the IP.
 
-    Returns
-    -------
-    result : tuple
-        float | Low temperature threshold. \n
-        float | High temperature threshold. \n
-        str | Temperature unit ('C' / 'F').
-    flag : char
-        99 (0x63) when successful.
+        Parameters
+        ----------
+        new_ip : str
+            Normal IPv4 format – four groups of digits divided with a dot.
 
-    """
-    # 0x53
+        Returns
+        -------
+        result : tuple
+            Empty.
+        flag : char
+            99 (0x63) when successful.
 
-    bytes_to_send = struct.pack("7s8sccccc",
-                                bytes(_CARDID, "utf8"),
-                                bytes(PASSWORD, "utf8"),
-                                bytes("\x53", "utf8"),
-                                bytes("\x00", "utf8"),
-                                bytes("\x00", "utf8"),
-                                bytes("\x00", "utf8"),
-                                channel.to_bytes(1, "big"))
+        """
+        # 0x06
 
-    SOCK.sendto(bytes_to_send, (TARGETIP, TARGETPORT))
+        bytes_to_send = self.prefix[0x06] + socket.inet_aton(new_ip)
 
-    msg = SOCK.recvfrom(34)
+        self.request(bytes_to_send, retries=1, timeout=CONFIG_TIMEOUT)
 
-    parsed = struct.unpack("xxxxffxxxxxxxxcxxxxxxxxxxxxx", msg[0])
+        flag = self.rx_buf[_OFS_FLAG]
 
-    if parsed[2] == b'\x01':
-        unit = "C"
+        result = _EMPTY_RESULT
 
-    if parsed[2] == b'\x02':
-        unit = "F"
+        return (result, flag)
 
-    result = (parsed[0], parsed[1], unit)
+    def firmware_version_read(self, force=False):
+        """
+        Read the firmware version. The version does not change while the device
+        is connected, so only the first successful reply after init() is
+        requested from the device; later calls return it again.
 
-    flag = msg[0][-2]
+        Parameters
+        ----------
+        force : bool, optional
+            Request the version from the device even if it is already known.
+            The default is False.
 
-    return (result, flag)
+        Returns
+        -------
+        result : tuple
+            str | 'x.y' (x is the main version number, y is the subversion number. Example: 1.0)
+        flag : char
+            99 (0x63) when successful.
 
+        """
+        # 0x07
 
-def all_temperature_limit_set(temperature_low0,
-                              temperature_high0,
-                              temperature_unit0,
-                              temperature_low1,
-                              temperature_high1,
-                              temperature_unit1,
-                              temperature_low2,
-                              temperature_high2,
-                              temperature_unit2,
-                              temperature_low3,
-                              temperature_high3,
-                              temperature_unit3):
-    """
-    Set temperature limits for all channels.
+        if self.fw is not None and not force:
+            return self.fw
 
-    Parameters
-    ----------
-    temperature_low0 : float
-        Low temperature threshold channel 0.
-    temperature_high0 : float
-        High temperature threshold channel 0.
-    temperature_unit0 : str
-        Temperature unit channel 0 ('C' / 'F').
-    temperature_low1 : float
-        Low temperature threshold channel 1.
-    temperature_high1 : float
-        High temperature threshold channel 1.
-    temperature_unit1 : str
-        Temperature unit channel 1 ('C' / 'F').
-    temperature_low2 : float
-        Low temperature threshold channel 2.
-    temperature_high2 : float
-        High temperature threshold channel 2.
-    temperature_unit2 : str
-        Temperature unit channel 2 ('C' / 'F').
-    temperature_low3 : float
-        Low temperature threshold channel 3.
-    temperature_high3 : float
-        High temperature threshold channel 3.
-    temperature_unit3 : str
-        Temperature unit channel 3 ('C' / 'F').
+        bytes_to_send = self.prefix[0x07]
 
-    Returns
-    -------
-    result : tuple
-        Empty.
-    flag : char
-        99 (0x63) when successful.
+        self.request(bytes_to_send)
 
-    """
-    # 0x54
+        reply = _parse_firmware(self.rx_buf)
 
-    temp_units = (temperature_unit0,
-                  temperature_unit1,
-                  temperature_unit2,
-                  temperature_unit3)
+        if reply[1] == 0x63:
+            self.fw = reply
 
-    temps_low = (temperature_low0,
-                 temperature_low1,
-                 temperature_low2,
-                 temperature_low3)
+        return reply
 
-    temps_high = (temperature_high0,
-                 temperature_high1,
-                 temperature_high2,
-                 temperature_high3)
+    def is_alive(self):
+        """
+        Check whether the device answers. Sends the firmware version request,
+        but neither parses nor caches the reply.
 
-    unit = [0, 0, 0, 0]
-    for i in range(4):
-        if temp_units[i] == "C":
-            unit[i] = b'\x01'
+        Returns
+        -------
+        alive : bool
+            True if the device replied successfully, False if it replied with an
+            error or did not reply at all.
 
-        if temp_units[i] == "F":
-            unit[i] = b'\x02'
+        """
+        # 0x07
 
-    parsed = [0, 0]
+        try:
+            self.request(self.prefix[0x07])
+        except OSError:
+            return False
 
-    for i in range(2):
+        return self.rx_buf[_OFS_FLAG] == 0x63
 
-        bytes_to_send = struct.pack("7s8scccccffffcc",
-                                    bytes(_CARDID, "utf8"),
-                                    bytes(PASSWORD, "utf8"),
-                                    bytes("\x54", "utf8"),
-                                    bytes("\x00", "utf8"),
-                                    i.to_bytes(1, "big"),
-                                    bytes("\x00", "utf8"),
-                                    i.to_bytes(1, "big"),
-                                    temps_low[2*i],
-                                    temps_high[2*i],
-                                    temps_low[2*i+1],
-                                    temps_high[2*i+1],
-                                    unit[2*i],
-                                    unit[2*i+1])
+    # ======================================================================= #
+    # output functions
+    # ======================================================================= #
 
-        SOCK.sendto(bytes_to_send, (TARGETIP, TARGETPORT))
+    def output_set(self,
+                   output0,
+                   output1,
+                   output2,
+                   output3):
+        """
+        Set output status; only for general purpose output, not for control.
 
-        msg = SOCK.recvfrom(34)
+        Parameters
+        ----------
+        output0 : int
+            Output status OUT0 (0 [inactive] / 1 [active]).
+        output1 : int
+            Output status OUT1 (0 [inactive] / 1 [active]).
+        output2 : int
+            Output status OUT2 (0 [inactive] / 1 [active]).
+        output3 : int
+            Output status OUT3 (0 [inactive] / 1 [active]).
 
-        parsed.append(struct.unpack("xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx", msg[0]))
+        Returns
+        -------
+        result : tuple
+            Empty.
+        flag : char
+            99 (0x63) when successful.
 
-    result = (parsed[0] + parsed[1])
+        """
+        # 0x30
 
-    flag = msg[0][-2]
+        output = output0 | (output1 << 1) | (output2 << 2) | (output3 << 3)
 
-    return (result, flag)
+        bytes_to_send = self.prefix[0x30] + bytes((0, output))
 
+        self.request(bytes_to_send)
 
-def all_temperature_limit_read():
-    """
-    Read temperature limits from all channels.
+        flag = self.rx_buf[_OFS_FLAG]
 
-    Returns
-    -------
-    result : tuple
-        float | Low temperature threshold channel 0. \n
-        float | High temperature threshold channel 0. \n
-        str | Temperature unit channel 0 ('C' / 'F'). \n
-        float | Low temperature threshold channel 1. \n
-        float | High temperature threshold channel 1. \n
-        str | Temperature unit channel 1 ('C' / 'F'). \n
-        float | Low temperature threshold channel 2. \n
-        float | High temperature threshold channel 2. \n
-        str | Temperature unit channel 2 ('C' / 'F'). \n
-        float | Low temperature threshold channel 3. \n
-        float | High temperature threshold channel 3. \n
-        str | Temperature unit channel 3 ('C' / 'F').
-    flag : char
-        99 (0x63) when successful.
+        result = _EMPTY_RESULT
 
-    """
-    # 0x55
+        return (result, flag)
 
-    bytes_to_send = struct.pack("7s8sccccc",
-                                bytes(_CARDID, "utf8"),
-                                bytes(PASSWORD, "utf8"),
-                                bytes("\x55", "utf8"),
-                                bytes("\x00", "utf8"),
-                                bytes("\x00", "utf8"),
-                                bytes("\x00", "utf8"),
-                                bytes("\x00", "utf8"))
+    def output_read(self):
+        """
+        Read the output status.
 
-    SOCK.sendto(bytes_to_send, (TARGETIP, TARGETPORT))
+        Returns
+        -------
+        result : tuple
+            int | Output status OUT0 (0 [inactive] / 1 [active]). \n
+            int | Output status OUT1 (0 [inactive] / 1 [active]). \n
+            int | Output status OUT2 (0 [inactive] / 1 [active]). \n
+            int | Output status OUT3 (0 [inactive] / 1 [active]).
+        flag : char
+            99 (0x63) when successful.
 
-    msg = SOCK.recvfrom(34)
+        """
+        # 0x31
 
-    parsed1 = struct.unpack("xxxxffffccxxxxxxxxxxxx", msg[0])
+        bytes_to_send = self.prefix[0x31]
 
-    bytes_to_send = struct.pack("7s8sccccc",
-                                bytes(_CARDID, "utf8"),
-                                bytes(PASSWORD, "utf8"),
-                                bytes("\x55", "utf8"),
-                                bytes("\x00", "utf8"),
-                                bytes("\x01", "utf8"),
-                                bytes("\x00", "utf8"),
-                                bytes("\x01", "utf8"))
+        self.request(bytes_to_send)
 
-    SOCK.sendto(bytes_to_send, (TARGETIP, TARGETPORT))
+        return _parse_output(self.rx_buf)
 
-    msg = SOCK.recvfrom(34)
+    def output_mode_set(self,
+                        output_mode0,
+                        output_mode1,
+                        output_mode2,
+                        output_mode3):
+        """
+        Set the output mode.
+
+        Parameters
+        ----------
+        output_mode0 : int
+            Output mode OUT0 (0 [general purpose] / 1 [temperature control]).
+        output_mode1 : int
+            Output mode OUT1 (0 [general purpose] / 1 [temperature control]).
+        output_mode2 : int
+            Output mode OUT2 (0 [general purpose] / 1 [temperature control]).
+        output_mode3 : int
+            Output mode OUT3 (0 [general purpose] / 1 [temperature control]).
+
+        Returns
+        -------
+        result : tuple
+            Empty.
+        flag : char
+            99 (0x63) when successful.
 
-    parsed2 = struct.unpack("xxxxffffccxxxxxxxxxxxx", msg[0])
+        """
+        # 0x32
 
-    temp_units = (
-        parsed1[4],
-        parsed1[5],
-        parsed2[4],
-        parsed2[5])
+        output = output_mode0 | (output_mode1 << 1) | \
+                 (output_mode2 << 2) | (output_mode3 << 3)
+
+        bytes_to_send = self.prefix[0x30] + bytes((0, output))
+
+        self.request(bytes_to_send)
+
+        flag = self.rx_buf[_OFS_FLAG]
+
+        result = _EMPTY_RESULT
+
+        return (result, flag)
+
+    def output_mode_read(self):
+        """
+        Read the output mode.
+
+        Returns
+        -------
+        result : tuple
+            int | Output mode OUT0 (0 [general purpose] / 1 [temperature control]). \n
+            int | Output mode OUT1 (0 [general purpose] / 1 [temperature control]). \n
+            int | Output mode OUT2 (0 [general purpose] / 1 [temperature control]). \n
+            int | Output mode OUT3 (0 [general purpose] / 1 [temperature control]).
+        flag : char
+            99 (0x63) when successful.
+
+        """
+        # 0x33
 
-    unit = [0, 0, 0, 0]
-    for i in range(0, 4):
-        if temp_units[i] == b'\x01':
-            unit[i] = "C"
+        bytes_to_send = self.prefix[0x33]
 
-        if temp_units[i] == b'\x02':
-            unit[i] = "F"
+        self.request(bytes_to_send)
+
+        return _parse_output(self.rx_buf)
+
+    # ======================================================================= #
+    # Analog measurement functions
+    # ======================================================================= #
+
+    def channel_temperature_read(self, channel):
+        """
+        Read the temperature and unit from one channel.
+
+        Parameters
+        ----------
+        channel : int
+            Channel to read from (0 / 1 / 2 / 3).
+
+        Returns
+        -------
+        result : tuple
+            float | Measured temperature. \n
+            str | Temperature unit ('C' / 'F').
+        flag : char
+            99 (0x63) when successful.
+
+        """
+        # 0x50
+
+        bytes_to_send = self.channel_request[0x50][channel]
+
+        self.request(bytes_to_send)
+
+        return _parse_temperature(self.rx_buf)
+
+    def all_temperature_read(self):
+        """
+        Read the temperature and unit from all channels.
+
+        Returns
+        -------
+        result : tuple
+            float | Measured temperature channel 0. \n
+            str | Temperature unit channel 0 ('C' / 'F'). \n
+            float | Measured temperature channel 1. \n
+            str | Temperature unit channel 1 ('C' / 'F'). \n
+            float | Measured temperature channel 2. \n
+            str | Temperature unit channel 2 ('C' / 'F'). \n
+            float | Measured temperature channel 3. \n
+            str | Temperature unit channel 3 ('C' / 'F').
+        flag : char
+            99 (0x63) when successful.
+
+        """
+        # 0x51
 
-    result = (parsed1[0], parsed1[1], unit[0],
-              parsed1[2], parsed1[3], unit[1],
-              parsed2[0], parsed2[1], unit[2],
-              parsed2[2], parsed2[3], unit[3])
+        bytes_to_send = self.prefix[0x51]
 
-    flag = msg[0][-2]
+        self.request(bytes_to_send)
 
-    return (result, flag)
+        return _parse_all_temperature(self.rx_buf)
 
+    # ======================================================================= #
+    # parameter functions
+    # ======================================================================= #
 
-def channel_sensor_type_set(channel,
-                            sensor_type):
-    """
-    Set sensor type for one channel.
+    def channel_temperature_limit_set(self,
+                                      channel,
+                                      temperature_low,
+                                      temperature_high,
+                                      temperature_unit):
+        """
+        Set temperature limits for one channel.
+
+        Parameters
+        ----------
+        channel : int
+            Channel to set (0 / 1 / 2 / 3).
+        temperature_low : float
+            Low temperature threshold.
+        temperature_high : float
+            High temperature threshold.
+        temperature_unit : str
+            Temperature unit ('C' / 'F').
+
+        Returns
+        -------
+        result : tuple
+            Empty.
+        flag : char
+            99 (0x63) when successful.
+
+        """
+        # 0x52
+
+        unit = _UNIT_CODE[temperature_unit]
+
+        payload = _REQ_TEMP_LIMIT.pack(_NUL,
+                                       _NUL,
+                                       _NUL,
+                                       channel.to_bytes(1, "big"),
+                                       temperature_low,
+                                       temperature_high,
+                                       _NUL,
+                                       _NUL,
+                                       _NUL,
+                                       _NUL,
+                                       _NUL,
+                                       _NUL,
+                                       _NUL,
+                                       _NUL,
+                                       unit)
+
+        bytes_to_send = self.prefix[0x52] + payload
+
+        self.request(bytes_to_send)
+
+        flag = self.rx_buf[_OFS_FLAG]
+
+        result = _EMPTY_RESULT
+
+        return (result, flag)
+
+    def channel_temperature_limit_read(self, channel):
+        """
+        Read temperature limits from one channel.
+
+        Parameters
+        ----------
+        channel : int
+            Channel to read from (0 / 1 / 2 / 3).
+
+        Returns
+        -------
+        result : tuple
+            float | Low temperature threshold. \n
+            float | High temperature threshold. \n
+            str | Temperature unit ('C' / 'F').
+        flag : char
+            99 (0x63) when successful.
+
+        """
+        # 0x53
+
+        bytes_to_send = self.channel_request[0x53][channel]
+
+        self.request(bytes_to_send)
+
+        limit = _RSP_FLOAT2.unpack_from(self.rx_buf, _OFS_FLOAT)
+
+        result = (limit[0], limit[1], _UNIT_TABLE[self.rx_buf[_OFS_UNIT]])
+
+        flag = self.rx_buf[_OFS_FLAG]
+
+        return (result, flag)
+
+    def all_temperature_limit_set(self,
+                                  temperature_low0,
+                                  temperature_high0,
+                                  temperature_unit0,
+                                  temperature_low1,
+                                  temperature_high1,
+                                  temperature_unit1,
+                                  temperature_low2,
+                                  temperature_high2,
+                                  temperature_unit2,
+                                  temperature_low3,
+                                  temperature_high3,
+                                  temperature_unit3):
+        """
+        Set temperature limits for all channels.
+
+        Parameters
+        ----------
+        temperature_low0 : float
+            Low temperature threshold channel 0.
+        temperature_high0 : float
+            High temperature threshold channel 0.
+        temperature_unit0 : str
+            Temperature unit channel 0 ('C' / 'F').
+        temperature_low1 : float
+            Low temperature threshold channel 1.
+        temperature_high1 : float
+            High temperature threshold channel 1.
+        temperature_unit1 : str
+            Temperature unit channel 1 ('C' / 'F').
+        temperature_low2 : float
+            Low temperature threshold channel 2.
+        temperature_high2 : float
+            High temperature threshold channel 2.
+        temperature_unit2 : str
+            Temperature unit channel 2 ('C' / 'F').
+        temperature_low3 : float
+            Low temperature threshold channel 3.
+        temperature_high3 : float
+            High temperature threshold channel 3.
+        temperature_unit3 : str
+            Temperature unit channel 3 ('C' / 'F').
+
+        Returns
+        -------
+        result : tuple
+            Empty.
+        flag : char
+            99 (0x63) when successful.
+
+        """
+        # 0x54
+
+        temp_units = (temperature_unit0,
+                      temperature_unit1,
+                      temperature_unit2,
+                      temperature_unit3)
+
+        temps_low = (temperature_low0,
+                     temperature_low1,
+                     temperature_low2,
+                     temperature_low3)
+
+        temps_high = (temperature_high0,
+                      temperature_high1,
+                      temperature_high2,
+                      temperature_high3)
+
+        unit = [_UNIT_CODE[temp_unit] for temp_unit in temp_units]
+
+        packets = []
+
+        for i in range(2):
+
+            # first request for channels 0 and 1, second for channels 2 and 3
+            half = bytes((i,))
+
+            payload = _REQ_TEMP_LIMIT_ALL.pack(_NUL,
+                                               half,
+                                               _NUL,
+                                               half,
+                                               temps_low[2*i],
+                                               temps_high[2*i],
+                                               temps_low[2*i+1],
+                                               temps_high[2*i+1],
+                                               unit[2*i],
+                                               unit[2*i+1])
+
+            packets.append(self.prefix[0x54] + payload)
+
+        replies = self.send_pipelined(packets)
+
+        result = _EMPTY_RESULT
+
+        flag = replies[-1][_OFS_FLAG]
+
+        return (result, flag)
+
+    def all_temperature_limit_read(self):
+        """
+        Read temperature limits from all channels.
+
+        Returns
+        -------
+        result : tuple
+            float | Low temperature threshold channel 0. \n
+            float | High temperature threshold channel 0. \n
+            str | Temperature unit channel 0 ('C' / 'F'). \n
+            float | Low temperature threshold channel 1. \n
+            float | High temperature threshold channel 1. \n
+            str | Temperature unit channel 1 ('C' / 'F'). \n
+            float | Low temperature threshold channel 2. \n
+            float | High temperature threshold channel 2. \n
+            str | Temperature unit channel 2 ('C' / 'F'). \n
+            float | Low temperature threshold channel 3. \n
+            float | High temperature threshold channel 3. \n
+            str | Temperature unit channel 3 ('C' / 'F').
+        flag : char
+            99 (0x63) when successful.
+
+        """
+        # 0x55
+
+        packets = (self.prefix[0x55] + b"\x00\x00\x00\x00",
+                   self.prefix[0x55] + b"\x00\x01\x00\x01")
+
+        replies = self.send_pipelined(packets)
+
+        reply1 = replies[0]
+        reply2 = replies[1]
+
+        limit1 = _RSP_FLOAT4.unpack_from(reply1, _OFS_FLOAT)
+        limit2 = _RSP_FLOAT4.unpack_from(reply2, _OFS_FLOAT)
+
+        result = (limit1[0], limit1[1], _UNIT_TABLE[reply1[_OFS_UNIT]],
+                  limit1[2], limit1[3], _UNIT_TABLE[reply1[_OFS_UNIT + 1]],
+                  limit2[0], limit2[1], _UNIT_TABLE[reply2[_OFS_UNIT]],
+                  limit2[2], limit2[3], _UNIT_TABLE[reply2[_OFS_UNIT + 1]])
+
+        flag = reply2[_OFS_FLAG]
+
+        return (result, flag)
 
-    Parameters
-    ----------
-    channel : int
-        Channel to set (0 / 1 / 2 / 3).
-    sensor_type : str
-        Sensor type ('Pt-1000' / 'Pt-100').
+    def channel_sensor_type_set(self,
+                                channel,
+                                sensor_type):
+        """
+        Set sensor type for one channel.
 
-    Returns
-    -------
-    result : tuple
-        Empty.
-    flag : char
-        99 (0x63) when successful.
+        Parameters
+        ----------
+        channel : int
+            Channel to set (0 / 1 / 2 / 3).
+        sensor_type : str
+            Sensor type ('Pt-1000' / 'Pt-100').
 
-    """
-    # 0x56
+        Returns
+        -------
+        result : tuple
+            Empty.
+        flag : char
+            99 (0x63) when successful.
 
-    if sensor_type == "Pt-1000":
-        sensor = b'\x01'
+        """
+        # 0x56
 
-    if sensor_type == "Pt-100":
-        sensor = b'\x02'
+        sensor = _SENSOR_CODE[sensor_type]
 
-    bytes_to_send = struct.pack("7s8sccccc16sc",
-                                bytes(_CARDID, "utf8"),
-                                bytes(PASSWORD, "utf8"),
-                                bytes("\x56", "utf8"),
-                                bytes("\x00", "utf8"),
-                                bytes("\x00", "utf8"),
-                                bytes("\x00", "utf8"),
-                                channel.to_bytes(1, "big"),
-                                bytes("\x00\x00\x00\x00 \
-                                     \x00\x00\x00\x00 \
-                                     \x00\x00\x00\x00 \
-                                     \x00\x00\x00\x00", "utf-8"),
-                                sensor)
+        payload = _REQ_SENSOR_TYPE.pack(_NUL,
+                                        _NUL,
+                                        _NUL,
+                                        channel.to_bytes(1, "big"),
+                                        _NUL16,
+                                        sensor)
+
+        bytes_to_send = self.prefix[0x56] + payload
+
+        self.request(bytes_to_send)
+
+        flag = self.rx_buf[_OFS_FLAG]
+
+        result = _EMPTY_RESULT
 
-    SOCK.sendto(bytes_to_send, (TARGETIP, TARGETPORT))
+        return (result, flag)
 
-    msg = SOCK.recvfrom(34)
+    def channel_sensor_type_read(self, channel):
+        """
+        Read sensor type from one channel.
 
-    parsed = struct.unpack("xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx", msg[0])
+        Parameters
+        ----------
+        channel : int
+            Channel to read from (0 / 1 / 2 / 3).
 
-    result = parsed
+        Returns
+        -------
+        result : tuple
+            str | Sensor type ('Pt-1000' / 'Pt-100').
+        flag : char
+            99 (0x63) when successful.
+
+        """
+        # 0x57
+
+        bytes_to_send = self.channel_request[0x57][channel]
+
+        self.request(bytes_to_send)
+
+        result = (_SENSOR_TABLE[self.rx_buf[_OFS_UNIT]],)
 
-    flag = msg[0][-2]
+        flag = self.rx_buf[_OFS_FLAG]
 
-    return (result, flag)
+        return (result, flag)
 
+    def all_sensor_type_set(self,
+                            sensor_type0,
+                            sensor_type1,
+                            sensor_type2,
+                            sensor_type3):
+        """
+        Set sensor type for all channels.
 
-def channel_sensor_type_read(channel):
-    """
-    Read sensor type from one channel.
+        Parameters
+        ----------
+        sensor_type0 : str
+            Sensor type channel 0 ('Pt-1000' / 'Pt-100').
+        sensor_type1 : str
+            Sensor type channel 1 ('Pt-1000' / 'Pt-100').
+        sensor_type2 : str
+            Sensor type channel 2 ('Pt-1000' / 'Pt-100').
+        sensor_type3 : str
+            Sensor type channel 3 ('Pt-1000' / 'Pt-100').
 
-    Parameters
-    ----------
-    channel : int
-        Channel to read from (0 / 1 / 2 / 3).
+        Returns
+        -------
+        result : tuple
+            Empty.
+        flag : char
+            99 (0x63) when successful.
 
-    Returns
-    -------
-    result : tuple
-        str | Sensor type ('Pt-1000' / 'Pt-100').
-    flag : char
-        99 (0x63) when successful.
+        """
+        # 0x58
 
-    """
-    # 0x57
+        sensor_types = (sensor_type0,
+                        sensor_type1,
+                        sensor_type2,
+                        sensor_type3)
 
-    bytes_to_send = struct.pack("7s8sccccc",
-                                bytes(_CARDID, "utf8"),
-                                bytes(PASSWORD, "utf8"),
-                                bytes("\x57", "utf8"),
-                                bytes("\x00", "utf8"),
-                                bytes("\x00", "utf8"),
-                                bytes("\x00", "utf8"),
-                                channel.to_bytes(1, "big"))
+        sensor = [_SENSOR_CODE[sensor_type] for sensor_type in sensor_types]
 
-    SOCK.sendto(bytes_to_send, (TARGETIP, TARGETPORT))
+        payload = _REQ_SENSOR_TYPE_ALL.pack(_NUL,
+                                            _NUL,
+                                            _NUL,
+                                            _NUL,
+                                            _NUL16,
+                                            sensor[0],
+                                            sensor[1],
+                                            sensor[2],
+                                            sensor[3])
 
-    msg = SOCK.recvfrom(34)
+        bytes_to_send = self.prefix[0x58] + payload
 
-    parsed = struct.unpack("xxxxxxxxxxxxxxxxxxxxcxxxxxxxxxxxxx", msg[0])
+        self.request(bytes_to_send)
 
-    sensor = 0
+        flag = self.rx_buf[_OFS_FLAG]
 
-    print(msg[0])
+        result = _EMPTY_RESULT
 
-    if parsed[0] == b'\x01':
-        sensor = "Pt-1000"
+        return (result, flag)
 
-    if parsed[0] == b'\x02':
-        sensor = "Pt-100"
+    def all_sensor_type_read(self):
+        """
+        Read sensor type from all channels.
 
-    result = (sensor,)
+        Returns
+        -------
+        result : tuple
+            str | Sensor type channel 0 ('Pt-1000' / 'Pt-100'). \n
+            str | Sensor type channel 1 ('Pt-1000' / 'Pt-100'). \n
+            str | Sensor type channel 2 ('Pt-1000' / 'Pt-100'). \n
+            str | Sensor type channel 3 ('Pt-1000' / 'Pt-100').
+        flag : char
+            99 (0x63) when successful.
 
-    flag = msg[0][-2]
+        """
+        # 0x59
 
-    return (result, flag)
+        bytes_to_send = self.prefix[0x59]
 
+        self.request(bytes_to_send)
 
-def all_sensor_type_set(sensor_type0,
-                        sensor_type1,
-                        sensor_type2,
-                        sensor_type3):
-    """
-    Set sensor type for all channels.
+        return _parse_all_sensor_type(self.rx_buf)
 
-    Parameters
-    ----------
-    sensor_type0 : str
-        Sensor type channel 0 ('Pt-1000' / 'Pt-100').
-    sensor_type1 : str
-        Sensor type channel 1 ('Pt-1000' / 'Pt-100').
-    sensor_type2 : str
-        Sensor type channel 2 ('Pt-1000' / 'Pt-100').
-    sensor_type3 : str
-        Sensor type channel 3 ('Pt-1000' / 'Pt-100').
+    def all_sensor_status_read(self):
+        """
+        Read sensor status from all channels.
 
-    Returns
-    -------
-    result : tuple
-        Empty.
-    flag : char
-        99 (0x63) when successful.
+        Returns
+        -------
+        result : tuple
+            int | Sensor status channel 0 (0 [normal] / 1 [broken]). \n
+            int | Sensor status channel 1 (0 [normal] / 1 [broken]). \n
+            int | Sensor status channel 2 (0 [normal] / 1 [broken]). \n
+            int | Sensor status channel 3 (0 [normal] / 1 [broken]). \n
+        flag : char
+            99 (0x63) when successful.
 
-    """
-    # 0x58
+        """
+        # 0x5A
 
-    sensor_types = (sensor_type0,
-                    sensor_type1,
-                    sensor_type2,
-                    sensor_type3)
+        bytes_to_send = self.prefix[0x5A]
 
-    sensor = [0, 0, 0, 0]
+        self.request(bytes_to_send)
 
-    for i in range(0, 4):
-        if sensor_types[i] == "Pt-1000":
-            sensor[i] = b'\x01'
+        return _parse_sensor_status(self.rx_buf)
 
-        if sensor_types[i] == "Pt-100":
-            sensor[i] = b'\x02'
+    # ======================================================================= #
+    # comparison functions
+    # ======================================================================= #
 
-    bytes_to_send = struct.pack("7s8sccccc16scccc",
-                              bytes(_CARDID, "utf8"),
-                              bytes(PASSWORD, "utf8"),
-                              bytes("\x58", "utf8"),
-                              bytes("\x00", "utf8"),
-                              bytes("\x00", "utf8"),
-                              bytes("\x00", "utf8"),
-                              bytes("\x00", "utf8"),
-                              bytes("\x00\x00\x00\x00 \
-                                     \x00\x00\x00\x00 \
-                                     \x00\x00\x00\x00 \
-                                     \x00\x00\x00\x00", "utf-8"),
-                              sensor[0],
-                              sensor[1],
-                              sensor[2],
-                              sensor[3])
+    def control_status_read(self):
+        """
+        Read the temperature comparison status.
 
-    SOCK.sendto(bytes_to_send, (TARGETIP, TARGETPORT))
+        Returns
+        -------
+        result : tuple
+            int | Temperature comparison status (0 [disabled] / 1 [enabled]).
+        flag : char
+            99 (0x63) when successful.
 
-    msg = SOCK.recvfrom(34)
+        """
+        # 0x5B
 
-    parsed = struct.unpack("xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx", msg[0])
+        bytes_to_send = self.prefix[0x5B]
 
-    result = parsed
+        self.request(bytes_to_send)
 
-    flag = msg[0][-2]
+        return _parse_control_status(self.rx_buf)
 
-    return (result, flag)
+    def control_enable(self):
+        """
+        Enable temperature comparison.
 
+        Returns
+        -------
+        result : tuple
+            Empty.
+        flag : char
+            99 (0x63) when successful.
 
-def all_sensor_type_read():
-    """
-    Read sensor type from all channels.
+        """
+        # 0x5C
 
-    Returns
-    -------
-    result : tuple
-        str | Sensor type channel 0 ('Pt-1000' / 'Pt-100'). \n
-        str | Sensor type channel 1 ('Pt-1000' / 'Pt-100'). \n
-        str | Sensor type channel 2 ('Pt-1000' / 'Pt-100'). \n
-        str | Sensor type channel 3 ('Pt-1000' / 'Pt-100').
-    flag : char
-        99 (0x63) when successful.
+        bytes_to_send = self.prefix[0x5C]
 
-    """
-    # 0x59
+        self.request(bytes_to_send)
 
-    bytes_to_send = struct.pack("7s8sc",
-                                bytes(_CARDID, "utf8"),
-                                bytes(PASSWORD, "utf8"),
-                                bytes("\x59", "utf8"))
+        result = _EMPTY_RESULT
 
-    SOCK.sendto(bytes_to_send, (TARGETIP, TARGETPORT))
+        flag = self.rx_buf[_OFS_FLAG]
 
-    msg = SOCK.recvfrom(34)
+        return (result, flag)
 
-    parsed = struct.unpack("xxxxxxxxxxxxxxxxxxxxccccxxxxxxxxxx", msg[0])
+    def control_disable(self):
+        """
+        Disable temperature comparison.
 
-    sensor = [0, 0, 0, 0]
+        Returns
+        -------
+        result : tuple
+            Empty.
+        flag : char
+            99 (0x63) when successful.
 
-    for i in range(0, 4):
-        if parsed[i] == b'\x01':
-            sensor[i] = "Pt-1000"
+        """
+        # 0x5D
 
-        if parsed[i] == b'\x02':
-            sensor[i] = "Pt-100"
+        bytes_to_send = self.prefix[0x5D]
 
-    result = (sensor[0],
-              sensor[1],
-              sensor[2],
-              sensor[3])
+        self.request(bytes_to_send)
 
-    flag = msg[0][-2]
+        result = _EMPTY_RESULT
 
-    return (result, flag)
+        flag = self.rx_buf[_OFS_FLAG]
 
+        return (result, flag)
 
-def all_sensor_status_read():
-    """
-    Read sensor status from all channels.
+    def control_mask_set(self,
+                         control_mask0,
+                         control_mask1,
+                         control_mask2,
+                         control_mask3):
+        """
+        Set the control mask. (?)
 
-    Returns
-    -------
-    result : tuple
-        int | Sensor status channel 0 (0 [normal] / 1 [broken]). \n
-        int | Sensor status channel 1 (0 [normal] / 1 [broken]). \n
-        int | Sensor status channel 2 (0 [normal] / 1 [broken]). \n
-        int | Sensor status channel 3 (0 [normal] / 1 [broken]). \n
-    flag : char
-        99 (0x63) when successful.
+        Parameters
+        ----------
+        control_mask0 : int
+            Control mask channel 0 (0 [unmask] / 1 [masked]).
+        control_mask1 : int
+            Control mask channel 1 (0 [unmask] / 1 [masked]).
+        control_mask2 : int
+            Control mask channel 2 (0 [unmask] / 1 [masked]).
+        control_mask3 : int
+            Control mask channel 3 (0 [unmask] / 1 [masked]).
 
-    """
-    # 0x5A
+        Returns
+        -------
+        result : tuple
+            Empty.
+        flag : char
+            99 (0x63) when successful.
 
-    bytes_to_send = struct.pack("7s8sc",
-                                bytes(_CARDID, "utf8"),
-                                bytes(PASSWORD, "utf8"),
-                                bytes("\x5A", "utf8"))
+        """
+        # 0x5E
 
-    SOCK.sendto(bytes_to_send, (TARGETIP, TARGETPORT))
+        control_mask = control_mask0 | (control_mask1 << 1) | \
+                       (control_mask2 << 2) | (control_mask3 << 3)
 
-    msg = SOCK.recvfrom(34)
+        bytes_to_send = self.prefix[0x5E] + bytes((0, control_mask))
 
-    parsed = struct.unpack("xxxxxxxxxxxxxxxxxxxxxxxxcxxxxxxxxx", msg[0])
+        self.request(bytes_to_send)
 
-    result = (ord(parsed[0]) & 1,
-              (ord(parsed[0]) & 2) >> 1,
-              (ord(parsed[0]) & 4) >> 2,
-              (ord(parsed[0]) & 8) >> 3)
+        result = _EMPTY_RESULT
 
-    flag = msg[0][-2]
+        flag = self.rx_buf[_OFS_FLAG]
 
-    return (result, flag)
+        return (result, flag)
 
+    def control_mask_read(self):
+        """
+        Read the control mask. (?)
 
-# =========================================================================== #
-# comparison functions
-# =========================================================================== #
+        Returns
+        -------
+        result : tuple
+            int | Control mask channel 0 (0 [unmask] / 1 [masked]). \n
+            int | Control mask channel 1 (0 [unmask] / 1 [masked]). \n
+            int | Control mask channel 2 (0 [unmask] / 1 [masked]). \n
+            int | Control mask channel 3 (0 [unmask] / 1 [masked]).
+        flag : char
+            99 (0x63) when successful.
 
+        """
+        # 0x5F
 
-def control_status_read():
-    """
-    Read the temperature comparison status.
+        bytes_to_send = self.prefix[0x5F]
 
-    Returns
-    -------
-    result : tuple
-        int | Temperature comparison status (0 [disabled] / 1 [enabled]).
-    flag : char
-        99 (0x63) when successful.
+        self.request(bytes_to_send)
 
-    """
-    # 0x5B
+        return _parse_control_mask(self.rx_buf)
 
-    bytes_to_send = struct.pack("7s8sc",
-                                bytes(_CARDID, "utf8"),
-                                bytes(PASSWORD, "utf8"),
-                                bytes("\x5B", "utf8"))
+    def wdt_enable(self):
+        """
+        Enable the watch dog timer.
 
-    SOCK.sendto(bytes_to_send, (TARGETIP, TARGETPORT))
+        Returns
+        -------
+        result : tuple
+            Empty.
+        flag : char
+            99 (0x63) when successful.
 
-    msg = SOCK.recvfrom(34)
+        """
+        # 0x60
 
-    parsed = struct.unpack("xxxxxxxxxxxxxxxxxxxxxxxxcxxxxxxxxx", msg[0])
+        bytes_to_send = self.prefix[0x60]
 
-    result = (ord(parsed[0]) - 1,)
+        self.request(bytes_to_send)
 
-    flag = msg[0][-2]
+        result = _EMPTY_RESULT
 
-    return (result, flag)
+        flag = self.rx_buf[_OFS_FLAG]
 
+        return (result, flag)
 
-def control_enable():
-    """
-    Enable temperature comparison.
+    def wdt_disable(self):
+        """
+        Disable the watch dog timer.
 
-    Returns
-    -------
-    result : tuple
-        Empty.
-    flag : char
-        99 (0x63) when successful.
+        Returns
+        -------
+        result : tuple
+            Empty.
+        flag : char
+            99 (0x63) when successful.
 
-    """
-    # 0x5C
+        """
+        # 0x61
 
-    bytes_to_send = struct.pack("7s8sc",
-                                bytes(_CARDID, "utf8"),
-                                bytes(PASSWORD, "utf8"),
-                                bytes("\x5C", "utf8"))
+        bytes_to_send = self.prefix[0x61]
 
-    SOCK.sendto(bytes_to_send, (TARGETIP, TARGETPORT))
+        self.request(bytes_to_send)
 
-    msg = SOCK.recvfrom(34)
+        result = _EMPTY_RESULT
 
-    parsed = struct.unpack("xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx", msg[0])
+        flag = self.rx_buf[_OFS_FLAG]
 
-    result = parsed
+        return (result, flag)
 
-    flag = msg[0][-2]
+    def wdt_set(self,
+                output_status0,
+                output_status1,
+                output_status2,
+                output_status3,
+                wait_time):
+        """
+        Set the watch dog timer configuration.
 
-    return (result, flag)
+        Parameters
+        ----------
+        outputStatus0 : int
+            Output status channel 0 (0 [disabled] / 1 [enabled]).
+        outputStatus1 : int
+            Output status channel 1 (0 [disabled] / 1 [enabled]).
+        outputStatus2 : int
+            Output status channel 2 (0 [disabled] / 1 [enabled]).
+        outputStatus3 : int
+            Output status channel 3 (0 [disabled] / 1 [enabled]).
+        waitTime : float
+            Wait time (10 - 10000 [time in 0.1 s]).
 
+        Returns
+        -------
+        result : tuple
+            Empty.
+        flag : char
+            99 (0x63) when successful.
 
-def control_disable():
-    """
-    Disable temperature comparison.
+        """
+        # 0x62
 
-    Returns
-    -------
-    result : tuple
-        Empty.
-    flag : char
-        99 (0x63) when successful.
+        output_status = output_status0 | (output_status1 << 1) | \
+                        (output_status2 << 2) | (output_status3 << 3)
 
-    """
-    # 0x5D
+        bytes_to_send = (self.prefix[0x62] +
+                         wait_time.to_bytes(2, "little", signed=True) +
+                         bytes((output_status,)))
 
-    bytes_to_send = struct.pack("7s8sc",
-                                bytes(_CARDID, "utf8"),
-                                bytes(PASSWORD, "utf8"),
-                                bytes("\x5D", "utf8"))
+        self.request(bytes_to_send)
 
-    SOCK.sendto(bytes_to_send, (TARGETIP, TARGETPORT))
+        result = _EMPTY_RESULT
 
-    msg = SOCK.recvfrom(34)
+        flag = self.rx_buf[_OFS_FLAG]
 
-    parsed = struct.unpack("xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx", msg[0])
+        return (result, flag)
 
-    result = parsed
+    def wdt_read(self):
+        """
+        Read watch dog timer configuration.
 
-    flag = msg[0][-2]
+        Returns
+        -------
+        result : tuple
+            int | Output status channel 0 (0 [disabled] / 1 [enabled]). \n
+            int | Output status channel 1 (0 [disabled] / 1 [enabled]). \n
+            int | Output status channel 2 (0 [disabled] / 1 [enabled]). \n
+            int | Output status channel 3 (0 [disabled] / 1 [enabled]). \n
+            float | Wait time (10 - 10000 [time in 0.1 s]). \n
+            int | Watch dog status (0 [disabled] / 1 [enabled]).
+        flag : char
+            99 (0x63) when successful.
 
-    return (result, flag)
+        """
+        # 0x63
 
+        bytes_to_send = self.prefix[0x63]
 
-def control_mask_set(control_mask0,
-                     control_mask1,
-                     control_mask2,
-                     control_mask3):
-    """
-    Set the control mask. (?)
+        self.request(bytes_to_send)
 
-    Parameters
-    ----------
-    control_mask0 : int
-        Control mask channel 0 (0 [unmask] / 1 [masked]).
-    control_mask1 : int
-        Control mask channel 1 (0 [unmask] / 1 [masked]).
-    control_mask2 : int
-        Control mask channel 2 (0 [unmask] / 1 [masked]).
-    control_mask3 : int
-        Control mask channel 3 (0 [unmask] / 1 [masked]).
+        return _parse_wdt(self.rx_buf)
 
-    Returns
-    -------
-    result : tuple
-        Empty.
-    flag : char
-        99 (0x63) when successful.
+    def control_mode_set(self, channel, mode):
+        """
+        Set the control mode for one channel; channel 0 controls OUT0, channel 1 controls OUT1, channel 2 controls OUT2, channel 3 controls OUT3.
 
-    """
-    # 0x5E
+        Parameters
+        ----------
+        channel : int
+            Channel to read from (0 / 1 / 2 / 3).
+        mode : int
+            Control mode \n
+                (0 [Over high temperature threshold ON, under low temperature theshold OFF] \n
+                1 [Over high temperature threshold OFF, under low temperature threshold ON] \n
+                2 [Within high temperature threshold and low temperature threshold ON else OFF] \n
+                3 [Within high temperature threshold and low temperature threshold OFF else ON]).
 
-    control_mask = (1 * control_mask0) | (2 * control_mask1) | \
-                   (4 * control_mask2) | (8 * control_mask3)
+        Returns
+        -------
+        result : tuple
+            Empty.
+        flag : char
+            99 (0x63) when successful.
 
-    bytes_to_send = struct.pack("7s8sccc",
-                              bytes(_CARDID, "utf8"),
-                              bytes(PASSWORD, "utf8"),
-                              bytes("\x5E", "utf8"),
-                              bytes("\x00", "utf8"),
-                              control_mask.to_bytes(1, "big"))
+        """
+        # 0x64
 
-    SOCK.sendto(bytes_to_send, (TARGETIP, TARGETPORT))
+        bytes_to_send = self.prefix[0x64] + bytes((0, channel, mode))
 
-    msg = SOCK.recvfrom(34)
+        self.request(bytes_to_send)
 
-    parsed = struct.unpack("xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx", msg[0])
+        result = _EMPTY_RESULT
 
-    result = parsed
+        flag = self.rx_buf[_OFS_FLAG]
 
-    flag = msg[0][-2]
+        return (result, flag)
 
-    return (result, flag)
+    def control_mode_read(self, channel):
+        """
+        Read the control mode for one channel.
 
+        Parameters
+        ----------
+        channel : int
+            Channel to read from (0 / 1 / 2 / 3).
 
-def control_mask_read():
-    """
-    Read the control mask. (?)
+        Returns
+        -------
+        result : tuple
+            int | Control mode \n
+                (0 [Over high temperature threshold ON, under low temperature theshold OFF] \n
+                1 [Over high temperature threshold OFF, under low temperature threshold ON] \n
+                2 [Within high temperature threshold and low temperature threshold ON else OFF] \n
+                3 [Within high temperature threshold and low temperature threshold OFF else ON]).
+        flag : char
+            99 (0x63) when successful.
 
-    Returns
-    -------
-    result : tuple
-        int | Control mask channel 0 (0 [unmask] / 1 [masked]). \n
-        int | Control mask channel 1 (0 [unmask] / 1 [masked]). \n
-        int | Control mask channel 2 (0 [unmask] / 1 [masked]). \n
-        int | Control mask channel 3 (0 [unmask] / 1 [masked]).
-    flag : char
-        99 (0x63) when successful.
+        """
+        # 0x65
 
-    """
-    # 0x5F
+        bytes_to_send = self.channel_request[0x65][channel]
 
-    bytes_to_send = struct.pack("7s8sc",
-                              bytes(_CARDID, "utf8"),
-                              bytes(PASSWORD, "utf8"),
-                              bytes("\x5F", "utf8"))
+        self.request(bytes_to_send)
 
-    SOCK.sendto(bytes_to_send, (TARGETIP, TARGETPORT))
+        result = (self.rx_buf[2],)
 
-    msg = SOCK.recvfrom(34)
+        flag = self.rx_buf[_OFS_FLAG]
 
-    parsed = struct.unpack("xcxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx", msg[0])
+        return (result, flag)
 
-    result = (ord(parsed[0]) & 1,
-              (ord(parsed[0]) & 2) >> 1,
-              (ord(parsed[0]) & 4) >> 2,
-              (ord(parsed[0]) & 8) >> 3)
+    # ======================================================================= #
+    # batch polling
+    # ======================================================================= #
 
-    flag = msg[0][-2]
+    def poll_batch(self, requests):
+        """
+        Run several reads with one batch of requests.
 
-    return (result, flag)
+        Parameters
+        ----------
+        requests : sequence of tuples
+            Name of the read function, followed by its arguments. Supported are
+            the reads listed in _BATCH_READS. Example:
+            [("channel_temperature_read", 0), ("output_read",)]
 
+        Returns
+        -------
+        results : list
+            (result, flag) per request, as returned by the read function.
 
-def wdt_enable():
+        """
+        packets = []
+        parsers = []
+
+        for name, *args in requests:
+            opcode, parser = _BATCH_READS[name]
+
+            if opcode in _CHANNEL_OPCODES:
+                packets.append(self.channel_request[opcode][args[0]])
+            else:
+                packets.append(self.prefix[opcode])
+
+            parsers.append(parser)
+
+        replies = self.send_pipelined(packets)
+
+        return [parser(reply) for parser, reply in zip(parsers, replies)]
+
+
+# =========================================================================== #
+# module-level functions
+# --------------------------------------------------------------------------- #
+# Thin wrappers that run the methods above on the device created by init().
+# =========================================================================== #
+
+def reboot_device():
     """
-    Enable the watch dog timer.
+    See EMA8314.reboot_device().
+    """
+    return _default.reboot_device()
 
-    Returns
-    -------
-    result : tuple
-        Empty.
-    flag : char
-        99 (0x63) when successful.
 
+def change_socket_port(new_socket_port):
+    """
+    See EMA8314.change_socket_port().
     """
-    # 0x60
+    return _default.change_socket_port(new_socket_port)
 
-    bytes_to_send = struct.pack("7s8sc",
-                              bytes(_CARDID, "utf8"),
-                              bytes(PASSWORD, "utf8"),
-                              bytes("\x60", "utf8"))
 
-    SOCK.sendto(bytes_to_send, (TARGETIP, TARGETPORT))
+def password_change(new_password):
+    """
+    See EMA8314.password_change().
+    """
+    return _default.password_change(new_password)
+
 
-    msg = SOCK.recvfrom(34)
+def password_set_default():
+    """
+    See EMA8314.password_set_default().
+    """
+    return _default.password_set_default()
 
-    parsed = struct.unpack("xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx", msg[0])
 
-    result = parsed
+def change_ip(new_ip):
+    """
+    See EMA8314.change_ip().
+    """
+    return _default.change_ip(new_ip)
 
-    flag = msg[0][-2]
 
-    return (result, flag)
+def firmware_version_read(force=False):
+    """
+    See EMA8314.firmware_version_read().
+    """
+    return _default.firmware_version_read(force)
 
 
-def wdt_disable():
+def is_alive():
     """
-    Disable the watch dog timer.
+    See EMA8314.is_alive().
+    """
+    return _default.is_alive()
 
-    Returns
-    -------
-    result : tuple
-        Empty.
-    flag : char
-        99 (0x63) when successful.
 
+def output_set(output0,
+               output1,
+               output2,
+               output3):
     """
-    # 0x61
+    See EMA8314.output_set().
+    """
+    return _default.output_set(output0, output1, output2, output3)
 
-    bytes_to_send = struct.pack("7s8sc",
-                              bytes(_CARDID, "utf8"),
-                              bytes(PASSWORD, "utf8"),
-                              bytes("\x61", "utf8"))
 
-    SOCK.sendto(bytes_to_send, (TARGETIP, TARGETPORT))
+def output_read():
+    """
+    See EMA8314.output_read().
+    """
+    return _default.output_read()
 
-    msg = SOCK.recvfrom(34)
 
-    parsed = struct.unpack("xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx", msg[0])
+def output_mode_set(output_mode0,
+                    output_mode1,
+                    output_mode2,
+                    output_mode3):
+    """
+    See EMA8314.output_mode_set().
+    """
+    return _default.output_mode_set(output_mode0,
+                                    output_mode1,
+                                    output_mode2,
+                                    output_mode3)
 
-    result = parsed
 
-    flag = msg[0][-2]
+def output_mode_read():
+    """
+    See EMA8314.output_mode_read().
+    """
+    return _default.output_mode_read()
 
-    return (result, flag)
 
+def channel_temperature_read(channel):
+    """
+    See EMA8314.channel_temperature_read().
+    """
+    return _default.channel_temperature_read(channel)
 
-def wdt_set(output_status0,
-            output_status1,
-            output_status2,
-            output_status3,
-            wait_time):
+
+def all_temperature_read():
     """
-    Set the watch dog timer configuration.
+    See EMA8314.all_temperature_read().
+    """
+    return _default.all_temperature_read()
 
-    Parameters
-    ----------
-    outputStatus0 : int
-        Output status channel 0 (0 [disabled] / 1 [enabled]).
-    outputStatus1 : int
-        Output status channel 1 (0 [disabled] / 1 [enabled]).
-    outputStatus2 : int
-        Output status channel 2 (0 [disabled] / 1 [enabled]).
-    outputStatus3 : int
-        Output status channel 3 (0 [disabled] / 1 [enabled]).
-    waitTime : float
-        Wait time (10 - 10000 [time in 0.1 s]).
 
-    Returns
-    -------
-    result : tuple
-        Empty.
-    flag : char
-        99 (0x63) when successful.
+def channel_temperature_limit_set(channel,
+                                  temperature_low,
+                                  temperature_high,
+                                  temperature_unit):
+    """
+    See EMA8314.channel_temperature_limit_set().
+    """
+    return _default.channel_temperature_limit_set(channel,
+                                                  temperature_low,
+                                                  temperature_high,
+                                                  temperature_unit)
+
 
+def channel_temperature_limit_read(channel):
+    """
+    See EMA8314.channel_temperature_limit_read().
     """
-    # 0x62
+    return _default.channel_temperature_limit_read(channel)
 
-    output_status = (1 * output_status0) | (2 * output_status1) | \
-                   (4 * output_status2) | (8 * output_status3)
 
-    bytes_to_send = struct.pack("7s8schc",
-                              bytes(_CARDID, "utf8"),
-                              bytes(PASSWORD, "utf8"),
-                              bytes("\x62", "utf8"),
-                              wait_time,
-                              output_status.to_bytes(1, "big"))
+def all_temperature_limit_set(temperature_low0,
+                              temperature_high0,
+                              temperature_unit0,
+                              temperature_low1,
+                              temperature_high1,
+                              temperature_unit1,
+                              temperature_low2,
+                              temperature_high2,
+                              temperature_unit2,
+                              temperature_low3,
+                              temperature_high3,
+                              temperature_unit3):
+    """
+    See EMA8314.all_temperature_limit_set().
+    """
+    return _default.all_temperature_limit_set(temperature_low0,
+                                              temperature_high0,
+                                              temperature_unit0,
+                                              temperature_low1,
+                                              temperature_high1,
+                                              temperature_unit1,
+                                              temperature_low2,
+                                              temperature_high2,
+                                              temperature_unit2,
+                                              temperature_low3,
+                                              temperature_high3,
+                                              temperature_unit3)
 
-    SOCK.sendto(bytes_to_send, (TARGETIP, TARGETPORT))
 
-    msg = SOCK.recvfrom(34)
+def all_temperature_limit_read():
+    """
+    See EMA8314.all_temperature_limit_read().
+    """
+    return _default.all_temperature_limit_read()
 
-    parsed = struct.unpack("xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx", msg[0])
 
-    result = parsed
+def channel_sensor_type_set(channel,
+                            sensor_type):
+    """
+    See EMA8314.channel_sensor_type_set().
+    """
+    return _default.channel_sensor_type_set(channel, sensor_type)
 
-    flag = msg[0][-2]
 
-    return (result, flag)
+def channel_sensor_type_read(channel):
+    """
+    See EMA8314.channel_sensor_type_read().
+    """
+    return _default.channel_sensor_type_read(channel)
 
 
-def wdt_read():
+def all_sensor_type_set(sensor_type0,
+                        sensor_type1,
+                        sensor_type2,
+                        sensor_type3):
+    """
+    See EMA8314.all_sensor_type_set().
     """
-    Read watch dog timer configuration.
+    return _default.all_sensor_type_set(sensor_type0,
+                                        sensor_type1,
+                                        sensor_type2,
+                                        sensor_type3)
 
-    Returns
-    -------
-    result : tuple
-        int | Output status channel 0 (0 [disabled] / 1 [enabled]). \n
-        int | Output status channel 1 (0 [disabled] / 1 [enabled]). \n
-        int | Output status channel 2 (0 [disabled] / 1 [enabled]). \n
-        int | Output status channel 3 (0 [disabled] / 1 [enabled]). \n
-        float | Wait time (10 - 10000 [time in 0.1 s]). \n
-        int | Watch dog status (0 [disabled] / 1 [enabled]).
-    flag : char
-        99 (0x63) when successful.
 
+def all_sensor_type_read():
     """
-    # 0x63
+    See EMA8314.all_sensor_type_read().
+    """
+    return _default.all_sensor_type_read()
 
-    bytes_to_send = struct.pack("7s8sc",
-                              bytes(_CARDID, "utf8"),
-                              bytes(PASSWORD, "utf8"),
-                              bytes("\x63", "utf8"))
 
-    SOCK.sendto(bytes_to_send, (TARGETIP, TARGETPORT))
+def all_sensor_status_read():
+    """
+    See EMA8314.all_sensor_status_read().
+    """
+    return _default.all_sensor_status_read()
 
-    msg = SOCK.recvfrom(34)
 
-    parsed = struct.unpack("hccxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx", msg[0])
+def control_status_read():
+    """
+    See EMA8314.control_status_read().
+    """
+    return _default.control_status_read()
 
-    outputs = (ord(parsed[1]) & 1,
-               (ord(parsed[1]) & 2) >> 1,
-               (ord(parsed[1]) & 4) >> 2,
-               (ord(parsed[1]) & 8) >> 3)
 
-    result = (outputs[0],
-              outputs[1],
-              outputs[2],
-              outputs[3],
-              parsed[0],
-              ord(parsed[2]) - 1)
+def control_enable():
+    """
+    See EMA8314.control_enable().
+    """
+    return _default.control_enable()
 
-    flag = msg[0][-2]
 
-    return (result, flag)
+def control_disable():
+    """
+    See EMA8314.control_disable().
+    """
+    return _default.control_disable()
 
 
-def control_mode_set(channel, mode):
+def control_mask_set(control_mask0,
+                     control_mask1,
+                     control_mask2,
+                     control_mask3):
     """
-    Set the control mode for one channel; channel 0 controls OUT0, channel 1 controls OUT1, channel 2 controls OUT2, channel 3 controls OUT3.
+    See EMA8314.control_mask_set().
+    """
+    return _default.control_mask_set(control_mask0,
+                                     control_mask1,
+                                     control_mask2,
+                                     control_mask3)
 
-    Parameters
-    ----------
-    channel : int
-        Channel to read from (0 / 1 / 2 / 3).
-    mode : int
-        Control mode \n
-            (0 [Over high temperature threshold ON, under low temperature theshold OFF] \n
-            1 [Over high temperature threshold OFF, under low temperature threshold ON] \n
-            2 [Within high temperature threshold and low temperature threshold ON else OFF] \n
-            3 [Within high temperature threshold and low temperature threshold OFF else ON]).
 
-    Returns
-    -------
-    result : tuple
-        Empty.
-    flag : char
-        99 (0x63) when successful.
+def control_mask_read():
+    """
+    See EMA8314.control_mask_read().
+    """
+    return _default.control_mask_read()
+
 
+def wdt_enable():
+    """
+    See EMA8314.wdt_enable().
     """
-    # 0x64
+    return _default.wdt_enable()
 
-    bytes_to_send = struct.pack("7s8scccc",
-                              bytes(_CARDID, "utf8"),
-                              bytes(PASSWORD, "utf8"),
-                              bytes("\x64", "utf8"),
-                              bytes("\x00", "utf8"),
-                              channel.to_bytes(1, "big"),
-                              mode.to_bytes(1, "big"))
 
-    SOCK.sendto(bytes_to_send, (TARGETIP, TARGETPORT))
+def wdt_disable():
+    """
+    See EMA8314.wdt_disable().
+    """
+    return _default.wdt_disable()
 
-    msg = SOCK.recvfrom(34)
 
-    parsed = struct.unpack("xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx", msg[0])
+def wdt_set(output_status0,
+            output_status1,
+            output_status2,
+            output_status3,
+            wait_time):
+    """
+    See EMA8314.wdt_set().
+    """
+    return _default.wdt_set(output_status0,
+                            output_status1,
+                            output_status2,
+                            output_status3,
+                            wait_time)
 
-    result = parsed
 
-    flag = msg[0][-2]
+def wdt_read():
+    """
+    See EMA8314.wdt_read().
+    """
+    return _default.wdt_read()
 
-    return (result, flag)
+
+def control_mode_set(channel, mode):
+    """
+    See EMA8314.control_mode_set().
+    """
+    return _default.control_mode_set(channel, mode)
 
 
 def control_mode_read(channel):
     """
-    Read the control mode for one channel.
+    See EMA8314.control_mode_read().
+    """
+    return _default.control_mode_read(channel)
 
-    Parameters
-    ----------
-    channel : int
-        Channel to read from (0 / 1 / 2 / 3).
 
-    Returns
-    -------
-    result : tuple
-        int | Control mode \n
-            (0 [Over high temperature threshold ON, under low temperature theshold OFF] \n
-            1 [Over high temperature threshold OFF, under low temperature threshold ON] \n
-            2 [Within high temperature threshold and low temperature threshold ON else OFF] \n
-            3 [Within high temperature threshold and low temperature threshold OFF else ON]).
-    flag : char
-        99 (0x63) when successful.
+def poll_batch(requests):
+    """
+    See EMA8314.poll_batch().
+    """
+    return _default.poll_batch(requests)
+
+
+# =========================================================================== #
+# asyncio interface
+# --------------------------------------------------------------------------- #
+# Runs the commands of EMA8314 on one worker thread per device, so waiting for
+# a reply does not block the loop and several devices can be polled
+# concurrently:
+#
+# devices = [await e.async_init(...), await e.async_init(...)]
+# readings = await asyncio.gather(*(d.all_temperature_read() for d in devices))
+# =========================================================================== #
 
+class _AsyncEMA8314:
     """
-    # 0x65
+    Coroutine interface to one device, created by async_init().
 
-    bytes_to_send = struct.pack("7s8sccc",
-                                bytes(_CARDID, "utf8"),
-                                bytes(PASSWORD, "utf8"),
-                                bytes("\x65", "utf8"),
-                                bytes("\x00", "utf8"),
-                                channel.to_bytes(1, "big"))
+    Every public method of EMA8314 is available as a coroutine with the same
+    arguments. The replies of the device do not name the request they belong
+    to, so the commands of one device run one after another on its own
+    worker thread. A command whose coroutine is cancelled still finishes
+    there before the next one starts.
+    """
 
-    SOCK.sendto(bytes_to_send, (TARGETIP, TARGETPORT))
+    __slots__ = ("device", "worker")
 
-    msg = SOCK.recvfrom(34)
+    def __init__(self, device):
+        self.device = device
+        self.worker = ThreadPoolExecutor(max_workers=1)
 
-    parsed = struct.unpack("xxcxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx", msg[0])
+    def __getattr__(self, name):
+        method = getattr(self.device, name)
 
-    result = (ord(parsed[0]),)
+        if name.startswith("_") or not callable(method):
+            raise AttributeError(name + " is not a command of EMA8314")
 
-    flag = msg[0][-2]
+        async def command(*args, **kwargs):
+            loop = asyncio.get_running_loop()
 
-    return (result, flag)
+            return await loop.run_in_executor(
+                self.worker, lambda: method(*args, **kwargs))
+
+        return command
+
+    def close(self):
+        """
+        Close the socket once the commands already started have finished.
+
+        Returns
+        -------
+        None.
+
+        """
+        self.worker.submit(self.device.close)
+        self.worker.shutdown(wait=False)
+
+
+async def async_init(host_ip,
+                     host_port,
+                     target_ip,
+                     target_port,
+                     password=PASSWORD):
+    """
+    Create the socket for one device and return its coroutine interface.
+    Independent of init() and of the module-level functions.
+
+    Parameters
+    ----------
+    host_ip : str
+        Normal IPv4 format – four groups of digits divided with a dot.
+    host_port : int
+        From 0 to 65535.
+    target_ip : str
+        Normal IPv4 format – four groups of digits divided with a dot.
+    target_port : int
+        From 1024 to 65535.
+    password : str [optional; if empty: default password "12345678"]
+        Up to 8 ASCII bytes.
+
+    Returns
+    -------
+    device : _AsyncEMA8314
+        Offers coroutine versions of the EMA8314 commands and close().
+
+    """
+    return _AsyncEMA8314(EMA8314(host_ip,
+                                 host_port,
+                                 target_ip,
+                                 target_port,
+                                 password))
 
 if __name__ == "__main__":
     print("This is not a standalone program; import it as a module!")
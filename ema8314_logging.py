@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+# -*- coding: UTF-8 -*-
+#
+# This file is part of the EMA8314 repository (https://github.com/marsmathis/ema8314).
+# Copyright 2022 Mathis Reuß-Hennschen.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, version 3.
+#
+# This program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Logging script for EMA-8314R ethernet I/O module.
+"""
+
+import ema8314 as e
+import time
+import datetime
+import signal
+import sys
+
+
+# =========================================================================== #
+# User-changeable variables
+# --------------------------------------------------------------------------- #
+# IP addresses and ports
+OWN_IP = "192.168.1.x"
+OWN_PORT = 17120
+REMOTE_IP = "192.168.1.y"
+REMOTE_PORT = 6936
+# --------------------------------------------------------------------------- #
+# set logging time interval (in seconds)
+INTERVAL = 1
+# --------------------------------------------------------------------------- #
+# set the separator symbol for the log file
+SEPARATOR = "\t"
+# --------------------------------------------------------------------------- #
+# change every line to True that should get included in the log file
+# temperature measurement per channel
+ALL_TEMP = True
+TEMP_0 = True
+TEMP_1 = True
+TEMP_2 = True
+TEMP_3 = True
+
+# sensor status per channel (sensor present or not)
+ALL_SENSOR = False
+SENSOR_0 = False
+SENSOR_1 = False
+SENSOR_2 = False
+SENSOR_3 = False
+
+# output status per channel (output on or off)
+ALL_OUTPUT = False
+OUTPUT_0 = False
+OUTPUT_1 = False
+OUTPUT_2 = False
+OUTPUT_3 = False
+# =========================================================================== #
+
+_INCLUDE_ARRAY = ( (TEMP_0,
+                    TEMP_1,
+                    TEMP_2,
+                    TEMP_3),
+                   (SENSOR_0,
+                    SENSOR_1,
+                    SENSOR_2,
+                    SENSOR_3),
+                   (OUTPUT_0,
+                    OUTPUT_1,
+                    OUTPUT_2,
+                    OUTPUT_3) )
+
+# the configuration does not change while logging, so what gets logged per
+# channel is worked out once: (channel, temperature, sensor status, output)
+# for every channel with at least one column
+_ACTIVE = tuple((channel, temperature, sensor, output)
+                for channel, temperature, sensor, output
+                in zip(range(4),
+                       (ALL_TEMP or include for include in _INCLUDE_ARRAY[0]),
+                       (ALL_SENSOR or include for include in _INCLUDE_ARRAY[1]),
+                       (ALL_OUTPUT or include for include in _INCLUDE_ARRAY[2]))
+                if temperature or sensor or output)
+_INCLUDE_TEMPERATURES = any(active[1] for active in _ACTIVE)
+_INCLUDE_OUTPUTS = any(active[3] for active in _ACTIVE)
+
+# everything one line needs is requested in a single batch; only ask for the
+# outputs and temperatures if at least one of them gets logged
+_REQUESTS = ((("all_sensor_status_read",),) +
+             ((("output_read",),) if _INCLUDE_OUTPUTS else ()) +
+             ((("all_temperature_read",),) if _INCLUDE_TEMPERATURES else ()))
+
+# log text per sensor status and output status (0 / 1)
+_SENSOR_TEXT = ("connected", "disconnected")
+_OUTPUT_TEXT = ("on", "off")
+# =========================================================================== #
+
+e.init(OWN_IP, OWN_PORT, REMOTE_IP, REMOTE_PORT)
+
+# the log file of the current day, see write()
+_log_date = None
+_log_file = None
+
+def write(log_string):
+    """
+    Write one line with a timestamp to the log file of the current day
+    (log_YYYY-MM-DD.log); a new file is started at midnight.
+
+    Parameters
+    ----------
+    log_string : str
+        String that gets written to the log file.
+
+    Returns
+    -------
+    None.
+
+    """
+    global _log_date
+    global _log_file
+    now = datetime.datetime.now().astimezone()
+    if now.date() != _log_date:
+        if _log_file is not None:
+            _log_file.close()
+        _log_date = now.date()
+        # line buffered, so every line is in the file as soon as it is logged
+        _log_file = open("log_" + _log_date.isoformat() + ".log", "a", buffering=1)
+    _log_file.write(now.isoformat(timespec="seconds") + log_string + "\n")
+
+def string():
+    """
+    Build the string that gets written to the log file.
+
+    Returns
+    -------
+    string : str
+        String that gets written to the log file.
+
+    """
+    # starts with an empty part, so the line starts with a separator
+    parts = [""]
+    replies = iter(e.poll_batch(_REQUESTS))
+    sensor_states = next(replies)[0]
+    if _INCLUDE_OUTPUTS:
+        output_states = next(replies)[0]
+    if _INCLUDE_TEMPERATURES:
+        # temperature and unit alternate per channel
+        temperatures = next(replies)[0][0::2]
+    for sensor, temperature, sensor_status, output_status in _ACTIVE:
+        if temperature:
+            if sensor_states[sensor] == 0:
+                parts.append(str(temperatures[sensor]))
+            else:
+                parts.append("NaN")
+
+        if sensor_status:
+            parts.append(_SENSOR_TEXT[sensor_states[sensor]])
+
+        if output_status:
+            parts.append(_OUTPUT_TEXT[output_states[sensor]])
+
+    return SEPARATOR.join(parts)
+
+def run():
+    """
+    Main loop that only gets interrupted by SIGINT (keyboard interrupt/CTRL+C).
+
+    Returns
+    -------
+    None.
+
+    """
+    next_time = time.monotonic()
+    while True:
+        # sleep until the next interval starts instead of for a whole
+        # interval, so the time spent reading does not add up to a drift
+        next_time += INTERVAL
+        delay = next_time - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+        try:
+            log_string = string()
+        except OSError:
+            # the device stopped answering (socket.timeout) or the network
+            # is gone; wait until it answers again
+            while not e.is_alive():
+                print("waiting...")
+                time.sleep(2)
+            next_time = time.monotonic()
+            continue
+        write(log_string)
+
+def signal_handler(signal, frame):
+    """
+    Handle SIGINT (keyboard interrupt) and exit cleanly by closing open socket
+    and the log file so it gets released.
+
+    Parameters
+    ----------
+    signal : int
+        Signal number.
+    frame : int
+        Interrupted stack frame.
+
+    Returns
+    -------
+    None.
+
+    """
+    e.close_socket()
+    print("socket closed")
+    if _log_file is not None:
+        _log_file.close()
+    sys.exit(0)
+
+if __name__ == "__main__":
+    signal.signal(signal.SIGINT, signal_handler)
+    run()
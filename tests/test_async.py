@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+# -*- coding: UTF-8 -*-
+#
+# This file is part of the EMA8314 repository (https://github.com/marsmathis/ema8314).
+# Copyright 2022 Mathis Reuß-Hennschen.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, version 3.
+#
+# This program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+# =========================================================================== #
+# The asyncio interface against fake devices on localhost. Run from the
+# repository root:
+#
+# python -m unittest discover -s tests
+# =========================================================================== #
+
+import asyncio
+import os
+import socket
+import struct
+import sys
+import threading
+import time
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir))
+
+import ema8314 as e
+
+
+class _SlowDevice:
+    """
+    Fake device on localhost that answers the temperature requests with the
+    requested channel number as temperature, each reply delay seconds late.
+    """
+
+    def __init__(self, delay):
+        self.sock = socket.socket(family=socket.AF_INET,
+                                  type=socket.SOCK_DGRAM)
+        self.sock.bind(("127.0.0.1", 0))
+        self.port = self.sock.getsockname()[1]
+        self.delay = delay
+
+        threading.Thread(target=self.serve, daemon=True).start()
+
+    def serve(self):
+        while True:
+            try:
+                request, address = self.sock.recvfrom(64)
+            except OSError:
+                return
+
+            time.sleep(self.delay)
+
+            reply = bytearray(34)
+            struct.pack_into("<f", reply, 4, request[-1])
+            reply[20] = 1
+            reply[32] = 0x63
+
+            self.sock.sendto(reply, address)
+
+    def close(self):
+        self.sock.close()
+
+
+class AsyncInterfaceTest(unittest.IsolatedAsyncioTestCase):
+
+    async def connect(self, delay):
+        device = _SlowDevice(delay)
+        self.addCleanup(device.close)
+
+        ema = await e.async_init("127.0.0.1", 0, "127.0.0.1", device.port)
+        self.addCleanup(ema.close)
+
+        return ema
+
+    async def test_concurrent_devices(self):
+        first = await self.connect(0.15)
+        second = await self.connect(0.15)
+
+        start = time.monotonic()
+
+        results = await asyncio.gather(first.channel_temperature_read(0),
+                                       second.channel_temperature_read(1),
+                                       first.channel_temperature_read(2),
+                                       second.channel_temperature_read(3))
+
+        elapsed = time.monotonic() - start
+
+        self.assertEqual([result[0][0] for result in results], [0, 1, 2, 3])
+
+        # two replies after each other per device, not four in a row
+        self.assertLess(elapsed, 0.5)
+
+    async def test_cancelled_command(self):
+        ema = await self.connect(0.05)
+
+        with self.assertRaises(asyncio.TimeoutError):
+            await asyncio.wait_for(ema.channel_temperature_read(1), 0.005)
+
+        channels = [3, 2, 0]
+        read = [(await ema.channel_temperature_read(channel))[0][0]
+                for channel in channels]
+
+        self.assertEqual(read, channels)
+
+    async def test_data_attributes(self):
+        ema = await self.connect(0)
+
+        for name in ("fw", "pending", "sock", "_send"):
+            with self.assertRaises(AttributeError):
+                getattr(ema, name)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+# -*- coding: UTF-8 -*-
+#
+# This file is part of the EMA8314 repository (https://github.com/marsmathis/ema8314).
+# Copyright 2022 Mathis Reuß-Hennschen.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, version 3.
+#
+# This program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+# =========================================================================== #
+# Replies that arrive after their request timed out must not be taken as the
+# reply to a later request. Run from the repository root:
+#
+# python -m unittest discover -s tests
+# =========================================================================== #
+
+import os
+import socket
+import struct
+import sys
+import threading
+import time
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir))
+
+import ema8314 as e
+
+
+class _DelayingDevice:
+    """
+    Fake device on localhost that answers the temperature requests with the
+    requested channel number as temperature. The reply to the request with
+    index delayed_index is sent 250 ms late.
+    """
+
+    def __init__(self, delayed_index):
+        self.sock = socket.socket(family=socket.AF_INET,
+                                  type=socket.SOCK_DGRAM)
+        self.sock.bind(("127.0.0.1", 0))
+        self.port = self.sock.getsockname()[1]
+        self.delayed_index = delayed_index
+
+        threading.Thread(target=self.serve, daemon=True).start()
+
+    def serve(self):
+        index = 0
+
+        while True:
+            try:
+                request, address = self.sock.recvfrom(64)
+            except OSError:
+                return
+
+            if index == self.delayed_index:
+                time.sleep(0.25)
+
+            index += 1
+
+            reply = bytearray(34)
+            struct.pack_into("<f", reply, 4, request[-1])
+            reply[20] = 1
+            reply[32] = 0x63
+
+            self.sock.sendto(reply, address)
+
+    def close(self):
+        self.sock.close()
+
+
+class DelayedReplyTest(unittest.TestCase):
+
+    def connect(self, delayed_index):
+        device = _DelayingDevice(delayed_index)
+        self.addCleanup(device.close)
+
+        ema = e.EMA8314("127.0.0.1", 0, "127.0.0.1", device.port)
+        self.addCleanup(ema.close)
+
+        return ema
+
+    def test_request(self):
+        ema = self.connect(0)
+
+        channels = [0, 1, 2, 3, 0, 1]
+        read = [ema.channel_temperature_read(channel)[0][0]
+                for channel in channels]
+
+        self.assertEqual(read, channels)
+
+    def test_poll_batch(self):
+        ema = self.connect(1)
+
+        batch = [("channel_temperature_read", channel) for channel in range(4)]
+
+        for attempt in range(3):
+            read = [result[0][0] for result in ema.poll_batch(batch)]
+
+            self.assertEqual(read, [0, 1, 2, 3])
+
+        self.assertEqual(ema.channel_temperature_read(2)[0][0], 2)
+
+
+
+if __name__ == "__main__":
+    unittest.main()